@@ -15,6 +15,10 @@ class AppConfig:
     VIEWPORT_WIDTH: int = 1920
     VIEWPORT_HEIGHT: int = 1080
     
+    # Worker processes for CPU-bound HTML extraction in batch scrapes; opt-in,
+    # the default of 1 extracts inline on the fetch threads
+    EXTRACTION_WORKERS: int = 1
+    
     # User Agent Rotation
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
@@ -5,20 +5,197 @@ This strategy handles common HTML patterns used by
 various dealer websites that don't have specific strategies.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import re
 import sys
+from functools import partial
+from itertools import islice
 import logging
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString, Comment, Tag
+import soupsieve as sv
 
 from ..base_scraper import ScraperStrategy
 from ...utils.address_parser import parse_address
 from ...utils.data_cleaner import data_cleaner
+from ...utils.parse_cache import LastParseCache
+
+
+# Card selectors compiled once; shared by detection and extraction
+_PANEL_SELECTOR = sv.compile("div.panel.panel-default")
+_LOCATION_CARD_SELECTOR = sv.compile("div.location.bg-main")
+
+# Common dealer patterns, any one of which makes can_handle accept the page
+# (div.panel.panel-default is covered by _PANEL_SELECTOR)
+_FALLBACK_PATTERN_SELECTOR = sv.compile(", ".join([
+    "div.car-details",  # HGreg
+    "div.location.dealer",  # Group 1 subpages
+    "div.dealerInfo",  # Sierra Auto Group
+    "div.fusion-layout-column",  # Gregory Auto Group
+    "div.card.border-0",  # Car wash sites
+    "li.location-result",  # Open Road
+    "h3.h4",  # All American Auto Group
+    "h2[class*='miles']",  # AutoBell
+    "a:-soup-contains('Directions')",
+    "a:-soup-contains('Contact')",
+]))
+
+# Extractors in run order, each gated on the selector its cards are found by.
+# Gated extractors are handed those cards; heuristic extractors with no gate
+# (None) always run and search the whole soup.
+_EXTRACTOR_GATES = (
+    ("Banister", "_extract_banister_style_dealers", "div.panel.panel-default"),
+    ("Bakhtiari", "_extract_bakhtiari_style_dealers", "div.location.bg-main"),
+    ("Colonial", "_extract_colonial_style_dealers", "div.get-direction__dealer-name"),
+    ("HGreg", "_extract_hgreg_dealers", "div.car-details"),
+    ("Ken Ganley", "_extract_ken_ganley_dealers", "div.panel.panel-default"),
+    ("Group1", "_extract_group1_subpage_dealers", "div.location.dealer"),
+    ("Sierra", "_extract_sierra_auto_dealers", "div.dealerInfo"),
+    ("Gregory", "_extract_gregory_auto_dealers", "div.fusion-layout-column"),
+    ("Carwash", "_extract_carwash_dealers", "div.card.border-0"),
+    ("Open Road", "_extract_open_road_dealers", "li.location-result"),
+    ("All American", "_extract_all_american_dealers", "h3.h4"),
+    ("AutoBell", "_extract_autobell_dealers", "h2 span"),
+    ("Dealeron", "_extract_dealeron_locations", None),
+    ("Heading/Address", "_extract_heading_address_blocks", None),
+)
+_GATE_MATCHERS = {
+    label: sv.compile(selector) for label, _, selector in _EXTRACTOR_GATES if selector
+}
+_ANY_GATE_SELECTOR = sv.compile(", ".join(
+    dict.fromkeys(selector for _, _, selector in _EXTRACTOR_GATES if selector)
+))
+
+# Content-bearing tags kept by the opt-in strained parse; <head>, top-level
+# <script>/<style>/<svg>, unlisted wrappers and stray text nodes are discarded
+# as they stream in. Text sitting directly in <body> or a dropped wrapper is
+# lost with them, so heading/address blocks can differ from a full parse.
+_CONTENT_STRAINER = SoupStrainer([
+    "main", "header", "footer", "nav", "aside", "section", "article", "div", "span",
+    "ul", "ol", "li", "table", "address", "p", "a", "strong",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+])
+
+# A class attribute naming one of the card classes above; pages can_handle
+# accepts on structure alone always contain one
+_CANDIDATE_CLASS_RE = re.compile(
+    r"""\bclass\s*=\s*["']?(?:[^"'>]*\s)?"""
+    r"(?:car-details|panel-default|bg-main|get-direction__dealer-name|dealer|dealerinfo"
+    r"|fusion-layout-column|border-0|location-result|h4|[\w-]*miles[\w-]*)"
+    r"""(?=[\s"'>])""",
+    re.IGNORECASE,
+)
+# An anchor whose content (up to its </a> or the next <a>) has the text the
+# Directions/Contact patterns look for; case-sensitive like :-soup-contains
+_ACTION_ANCHOR_RE = re.compile(r"<[aA]\b(?:[^<]|<(?!/[aA]\s*>|[aA]\b))*?(?:Directions|Contact)")
+_KNOWN_HOSTS = ("banistercars.com", "bakhtiariauto.com", "aschenbachautogroup.com", "bakerautogroup.com")
+
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_SALES_PHONE_RE = re.compile(r"Sales Phone:\s*(\d[\d-]+)")
+# Phone and "City, ST 12345[-1234]" lines in DealerOn cards and heading blocks
+_BLOCK_PHONE_RE = re.compile(r"\(??\d{3}\)??[\-\.\s]?\d{3}[\-\.\s]?\d{4}")
+_BLOCK_CITY_STATE_ZIP_RE = re.compile(r"([^,\n]+),\s*([A-Z]{2})\s*(\d{5})(?:-\d{4})?")
+# Per-site "City, ST 12345" line formats
+_GROUP1_CITY_LINE_RE = re.compile(r"([\w\s\.-]+),\s*([A-Z]{2})\s*(\d{5})")
+_GREGORY_CITY_LINE_RE = re.compile(r"^([^,]+),\s*([A-Z]{2})\s+(\d{5})$")
+_ALL_AMERICAN_CITY_LINE_RE = re.compile(r"^(.+?),\s*([A-Z]{2}),?\s*(\d{5})$")
+_AUTOBELL_CITY_LINE_RE = re.compile(r"(.+),\s*([A-Z]{2})\s*(\d{5})")
+# "Street, City ST 12345" with a single comma
+_COLONIAL_ADDRESS_RE = re.compile(r'^([^,]*),\s*([^,]+?)\s+([A-Z]{2})\s+(\d{5})$')
+
+# Street-type keywords that mark a paragraph as an address (substring match, any case)
+_ADDRESS_KW_RE = re.compile(
+    r"blvd|street|road|ave|dr|freeway|fwy|pkwy|ste|suite|way|ln|lane|ct|court|pl|place|hwy|st|rd|main|hill|kansas",
+    re.IGNORECASE,
+)
+# Phone numbers and address keywords found in one left-to-right scan; the two
+# alternatives never overlap (digits/parens vs. letters)
+_CARD_SCAN_RE = re.compile(
+    r"(?P<phone>" + _PHONE_RE.pattern + ")|(?P<address>" + _ADDRESS_KW_RE.pattern + ")",
+    re.IGNORECASE,
+)
+# Handles both "Houston, TX 77034" and "Houston TX 77034"
+_CARD_CITY_LINE_RE = re.compile(r'([^,]+),?\s*([A-Z]{2})\s*(\d{5})')
+# Link texts that mark a DealerOn-style location card
+_ACTION_LINK_RE = re.compile(r"^\s*(?:directions|contact(?: us)?|visit (?:site|website))\s*$", re.IGNORECASE)
+
+
+def _dealer_row(name: str, street: str, city: str, state: str,
+                zip_code: str, phone: str, website: str) -> Dict[str, Any]:
+    """Build a dealer record with the standard keys."""
+    return {
+        "name": name,
+        "street": street,
+        "city": city,
+        "state": state,
+        "zip": zip_code,
+        "phone": phone,
+        "website": website,
+    }
+
+
+def _classify_card_paragraph(p_text: str) -> Tuple[str, str, str, str, str]:
+    """
+    Classify one newline-separated card paragraph as a phone or address block.
+    
+    Pure str -> tuple kernel shared by the panel/location card extractors, kept
+    free of bs4 objects so it stays cheap to call per paragraph.
+    
+    Returns:
+        Tuple of (phone, street, city, state, zip); fields not found are empty.
+        A phone match short-circuits address parsing.
+    """
+    has_address_keyword = False
+    for match in _CARD_SCAN_RE.finditer(p_text):
+        if match.lastgroup == "phone":
+            return match.group(0), "", "", "", ""
+        has_address_keyword = True
+    if not has_address_keyword:
+        return "", "", "", "", ""
+    lines = [line.strip() for line in p_text.split("\n") if line.strip()]
+    if len(lines) < 2:
+        return "", "", "", "", ""
+    # First line is street, second is city, state, zip
+    city_match = _CARD_CITY_LINE_RE.match(lines[1])
+    if city_match:
+        city, state, zip_code = city_match.groups()
+        return "", lines[0], city, state, zip_code
+    return "", lines[0], "", "", ""
+
+
+def _paragraph_text(p) -> str:
+    """Same as p.get_text('\\n', strip=True), read straight off the children for text-and-<br> paragraphs."""
+    lines: List[str] = []
+    for child in p.children:
+        if type(child) is NavigableString:
+            text = child.strip()
+            if text:
+                lines.append(text)
+        elif child.name != "br":
+            # Inline tags, comments, etc.: let bs4 collect the strings
+            return p.get_text("\n", strip=True)
+    return "\n".join(lines)
+
+
+def _text_lines(element) -> List[str]:
+    """Non-empty, stripped text lines of an element in a single pass over its strings."""
+    lines: List[str] = []
+    for text in element.stripped_strings:
+        if "\n" in text:
+            lines.extend(ln.strip() for ln in text.split("\n") if ln.strip())
+        else:
+            lines.append(text)
+    return lines
 
 
 class GenericDealerStrategy(ScraperStrategy):
-    def __init__(self):
+    def __init__(self, full_parse: bool = True):
         self.logger = logging.getLogger(__name__)
+        # Parse the whole document; False parses content tags only, which is
+        # cheaper but only safe for pages whose dealers sit in card elements
+        self.full_parse = full_parse
+        # Page tree built in can_handle, handed back to extract_dealers for the same html
+        parse_only = None if full_parse else _CONTENT_STRAINER
+        self._parse = LastParseCache(partial(BeautifulSoup, features="lxml", parse_only=parse_only))
 
     """Extracts dealer data from generic dealer HTML structures."""
     
@@ -28,32 +205,34 @@ class GenericDealerStrategy(ScraperStrategy):
     
     def can_handle(self, html: str, page_url: str) -> bool:
         """Check if page contains generic dealer structures."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Look for common dealer patterns
-        patterns = [
-            "div.car-details",  # HGreg
-            "div.panel.panel-default",  # Ken Ganley
-            "div.location.dealer",  # Group 1 subpages
-            "div.dealerInfo",  # Sierra Auto Group
-            "div.fusion-layout-column",  # Gregory Auto Group
-            "div.card.border-0",  # Car wash sites
-            "li.location-result",  # Open Road
-            "h3.h4",  # All American Auto Group
-            "h2[class*='miles']",  # AutoBell
-            "a:contains('Directions')",
-            "a:contains('Contact')",
-        ]
+        if page_url and any(host in page_url.lower() for host in _KNOWN_HOSTS):
+            return True
+
+        lowered = html.lower()
+        if "dealeron" in lowered:
+            return True
+
+        # Cheap reject before paying for a full parse: no card class, no
+        # Directions/Contact anchor and no 'Our Locations' heading block
+        has_locations_heading = "our locations" in lowered
+        if (
+            not has_locations_heading
+            and _CANDIDATE_CLASS_RE.search(html) is None
+            and _ACTION_ANCHOR_RE.search(html) is None
+        ):
+            return False
+
+        soup = self._parse(html)
         
         # Check for Banister-style dealer location cards (panel-based layout)
-        dealer_panels = soup.find_all('div', class_=lambda x: x and 'panel' in x and 'panel-default' in x)
+        dealer_panels = _PANEL_SELECTOR.select(soup)
         self.logger.debug(f"DEBUG: Found {len(dealer_panels)} dealer panels with panel/panel-default classes")
         if len(dealer_panels) >= 3:
             self.logger.debug(f"DEBUG: Banister panel detection SUCCESS - found {len(dealer_panels)} panels")
             return True
             
         # Check for Bakhtiari-style dealer location cards (location class layout)
-        dealer_locations = soup.find_all('div', class_=lambda x: x and 'location' in x and 'bg-main' in x)
+        dealer_locations = _LOCATION_CARD_SELECTOR.select(soup)
         self.logger.debug(f"DEBUG: Found {len(dealer_locations)} dealer locations with location/bg-main classes")
         if len(dealer_locations) >= 3:
             self.logger.debug(f"DEBUG: Bakhtiari location detection SUCCESS - found {len(dealer_locations)} locations")
@@ -71,95 +250,51 @@ class GenericDealerStrategy(ScraperStrategy):
             self.logger.debug(f"DEBUG: Colonial detection SUCCESS - found {colonial_count} dealers")
             return True
         
-        for pattern in patterns:
-            try:
-                if soup.select(pattern):
-                    return True
-            except Exception:
-                # Some selectors like :contains aren't supported by bs4; skip errors
-                pass
-
-        # Heuristics: 'Our Locations' marker with many headings or phone numbers
-        page_text = soup.get_text(" ", strip=True).lower()
-        if "our locations" in page_text and len(soup.find_all(["h2", "h3", "h4"])) >= 3:
-            return True
-        if "dealeron" in page_text:
+        # Any single common dealer pattern; panels were already selected above
+        if dealer_panels or _FALLBACK_PATTERN_SELECTOR.select_one(soup) is not None:
             return True
-        if page_url and any(host in page_url.lower() for host in ["banistercars.com", "bakhtiariauto.com", "aschenbachautogroup.com", "bakerautogroup.com"]):
+
+        # Heuristic: 'Our Locations' marker with many headings, checked against
+        # the lowercased raw HTML rather than a get_text() copy
+        if has_locations_heading and len(soup.find_all(["h2", "h3", "h4"])) >= 3:
             return True
         
         return False
     
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from generic dealer HTML structures."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         dealers = []
         
-        # Try different extraction methods
-        banister_dealers = self._extract_banister_style_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Banister extraction found {len(banister_dealers)} dealers")
-        dealers.extend(banister_dealers)
-        
-        bakhtiari_dealers = self._extract_bakhtiari_style_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Bakhtiari extraction found {len(bakhtiari_dealers)} dealers")
-        dealers.extend(bakhtiari_dealers)
-        
-        colonial_dealers = self._extract_colonial_style_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Colonial extraction found {len(colonial_dealers)} dealers")
-        dealers.extend(colonial_dealers)
-        
-        hgreg_dealers = self._extract_hgreg_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: HGreg extraction found {len(hgreg_dealers)} dealers")
-        dealers.extend(hgreg_dealers)
-        
-        ken_ganley_dealers = self._extract_ken_ganley_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Ken Ganley extraction found {len(ken_ganley_dealers)} dealers")
-        dealers.extend(ken_ganley_dealers)
-        
-        group1_dealers = self._extract_group1_subpage_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Group1 extraction found {len(group1_dealers)} dealers")
-        dealers.extend(group1_dealers)
-        
-        sierra_dealers = self._extract_sierra_auto_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Sierra extraction found {len(sierra_dealers)} dealers")
-        dealers.extend(sierra_dealers)
-        
-        gregory_dealers = self._extract_gregory_auto_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Gregory extraction found {len(gregory_dealers)} dealers")
-        dealers.extend(gregory_dealers)
-        
-        carwash_dealers = self._extract_carwash_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Carwash extraction found {len(carwash_dealers)} dealers")
-        dealers.extend(carwash_dealers)
-        
-        open_road_dealers = self._extract_open_road_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: Open Road extraction found {len(open_road_dealers)} dealers")
-        dealers.extend(open_road_dealers)
-        
-        all_american_dealers = self._extract_all_american_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: All American extraction found {len(all_american_dealers)} dealers")
-        dealers.extend(all_american_dealers)
-        
-        autobell_dealers = self._extract_autobell_dealers(soup, page_url)
-        self.logger.debug(f"DEBUG: AutoBell extraction found {len(autobell_dealers)} dealers")
-        dealers.extend(autobell_dealers)
-        dealeron_dealers = self._extract_dealeron_locations(soup, page_url)
-        self.logger.debug(f"DEBUG: Dealeron extraction found {len(dealeron_dealers)} dealers")
-        dealers.extend(dealeron_dealers)
-        
-        heading_dealers = self._extract_heading_address_blocks(soup, page_url)
-        self.logger.debug(f"DEBUG: Heading/Address extraction found {len(heading_dealers)} dealers")
-        dealers.extend(heading_dealers)
+        # Only run the extractors whose card structure is present on the page
+        gate_cards = self._collect_gate_cards(soup)
+        self.logger.debug(f"DEBUG: Detected dealer layouts: {sorted(gate_cards)}")
+        for label, method_name, selector in _EXTRACTOR_GATES:
+            if selector is None:
+                found = getattr(self, method_name)(soup, page_url)
+            elif label in gate_cards:
+                found = getattr(self, method_name)(gate_cards[label], page_url)
+            else:
+                continue
+            self.logger.debug(f"DEBUG: {label} extraction found {len(found)} dealers")
+            dealers.extend(found)
         
         self.logger.debug(f"DEBUG: Generic dealer strategy extracted {len(dealers)} dealers")
         return dealers
 
-    def _extract_banister_style_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _collect_gate_cards(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """Route every element matching a gate selector to the extractors it gates, in one walk."""
+        gate_cards: Dict[str, List[Tag]] = {}
+        for el in _ANY_GATE_SELECTOR.iselect(soup):
+            for label, matcher in _GATE_MATCHERS.items():
+                if matcher.match(el):
+                    gate_cards.setdefault(label, []).append(el)
+        return gate_cards
+
+    def _extract_banister_style_dealers(self, dealer_panels: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Banister-style location pages with panel cards."""
         dealers = []
         
-        # Look for panel-based dealer cards
-        dealer_panels = soup.find_all('div', class_=lambda x: x and 'panel' in x and 'panel-default' in x)
         self.logger.debug(f"DEBUG: _extract_banister_style_dealers found {len(dealer_panels)} panels")
         
         if not dealer_panels:
@@ -185,53 +320,33 @@ class GenericDealerStrategy(ScraperStrategy):
             
             # Get all paragraph elements
             p_elements = panel.find_all('p', class_='larger')
-            self.logger.debug(f"DEBUG: Panel found {len(p_elements)} p.larger elements")
+            self.logger.debug("DEBUG: Panel found %d p.larger elements", len(p_elements))
             
             for p in p_elements:
-                # CRITICAL: Use get_text() with separator to preserve <br> as line breaks!
-                p_text = p.get_text('\n', strip=True)  
-                self.logger.debug(f"DEBUG: p_text with line breaks: '{p_text}'")
+                # CRITICAL: <br> must come through as a line break!
+                p_text = _paragraph_text(p)
+                self.logger.debug("DEBUG: p_text with line breaks: '%s'", p_text)
                 
-                # Check if this paragraph contains a phone number
-                phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', p_text)
-                if phone_match:
-                    phone = phone_match.group(0)
-                    self.logger.debug(f"DEBUG: Found phone: {phone}")
+                p_phone, p_street, p_city, p_state, p_zip = _classify_card_paragraph(p_text)
+                if p_phone:
+                    phone = p_phone
+                    self.logger.debug("DEBUG: Found phone: %s", phone)
                     continue
                 
-                # Check if this paragraph contains an address
                 # Address format: "930 N Battlefield Blvd\nChesapeake, VA 23320"
-                address_keywords = ['blvd', 'street', 'road', 'ave', 'dr', 'freeway', 'fwy', 'pkwy', 'ste', 'suite', 'way', 'ln', 'lane', 'ct', 'court', 'pl', 'place', 'hwy', 'st', 'rd', 'ave', 'drive', 'main', 'hill', 'kansas']
-                if not phone_match and any(keyword in p_text.lower() for keyword in address_keywords):
-                    lines = [line.strip() for line in p_text.split('\n') if line.strip()]
-                    self.logger.debug(f"DEBUG: Address paragraph has {len(lines)} lines: {lines}")
-                    if len(lines) >= 2:
-                        # First line is street
-                        street = lines[0]
-                        
-                        # Second line is city, state, zip
-                        # Handle both "Houston, TX 77034" and "Houston TX 77034" formats
-                        city_line = lines[1]
-                        city_match = re.match(r'([^,]+),?\s*([A-Z]{2})\s*(\d{5})', city_line)
-                        if city_match:
-                            city, state, zip_code = city_match.groups()
-                            self.logger.debug(f"DEBUG: Parsed address - street='{street}', city='{city}', state='{state}'")
+                if p_street:
+                    street = p_street
+                if p_city:
+                    city, state, zip_code = p_city, p_state, p_zip
+                    self.logger.debug("DEBUG: Parsed address - street='%s', city='%s', state='%s'", street, city, state)
             
             # If we got basic info, add the dealer
-            self.logger.debug(f"DEBUG: Panel processed - name='{name}', street='{street}', city='{city}'")
+            self.logger.debug("DEBUG: Panel processed - name='%s', street='%s', city='%s'", name, street, city)
             if name and street:
-                self.logger.debug(f"DEBUG: Adding dealer: {name}")
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": page_url
-                })
+                self.logger.debug("DEBUG: Adding dealer: %s", name)
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, page_url))
             else:
-                self.logger.debug(f"DEBUG: Skipping panel - missing name or street")
+                self.logger.debug("DEBUG: Skipping panel - missing name or street")
         
         return dealers
 
@@ -240,11 +355,12 @@ class GenericDealerStrategy(ScraperStrategy):
         Heuristics based: cards with Directions/Contact links, heading for name, two-line address, phone.
         """
         dealers: List[Dict[str, Any]] = []
-        containers = set()
-        # Find candidate action links
-        for link in soup.find_all("a"):
-            text = (link.get_text(strip=True) or "").lower()
-            if text in {"directions", "contact", "contact us", "visit site", "visit website"}:
+        # Keyed by id() so insertion is O(1) and ordered; bs4 Tag equality compares whole subtrees
+        containers: Dict[int, Any] = {}
+        # Find candidate action links from one pass over the text nodes
+        for action_text in soup.find_all(string=_ACTION_LINK_RE):
+            link = action_text.find_parent("a")
+            if link is not None:
                 # Walk up to a reasonable container
                 parent = link
                 depth = 0
@@ -252,23 +368,20 @@ class GenericDealerStrategy(ScraperStrategy):
                     parent = parent.parent
                     depth += 1
                 if parent and parent.name in ("section", "article", "li", "div"):
-                    containers.add(parent)
+                    containers.setdefault(id(parent), parent)
 
-        phone_pattern = re.compile(r"\(??\d{3}\)??[\-\.\s]?\d{3}[\-\.\s]?\d{4}")
-        city_state_zip_pattern = re.compile(r"([^,\n]+),\s*([A-Z]{2})\s*(\d{5})(?:-\d{4})?")
 
-        for container in list(containers):
+        for container in containers.values():
             # Name: first heading inside or just above
             name_el = container.find(["h1", "h2", "h3", "h4", "h5", "h6"]) or container.find_previous_sibling(["h2", "h3", "h4"]) or container.find_previous(["h2", "h3"]) 
             name = name_el.get_text(strip=True) if name_el else ""
 
             # Text content lines
-            text_block = container.get_text("\n", strip=True)
-            lines = [ln.strip() for ln in text_block.split("\n") if ln.strip()]
+            lines = _text_lines(container)
             # Find city/state/zip line
             street = city = state = zip_code = phone = ""
             for idx, ln in enumerate(lines):
-                m = city_state_zip_pattern.search(ln)
+                m = _BLOCK_CITY_STATE_ZIP_RE.search(ln)
                 if m:
                     city, state, zip_code = m.groups()
                     # Street is likely the previous non-empty line
@@ -277,7 +390,7 @@ class GenericDealerStrategy(ScraperStrategy):
                     break
             # Phone
             for ln in lines:
-                pm = phone_pattern.search(ln)
+                pm = _BLOCK_PHONE_RE.search(ln)
                 if pm:
                     phone = pm.group(0)
                     break
@@ -287,15 +400,10 @@ class GenericDealerStrategy(ScraperStrategy):
                     # Sometimes street is above heading; best effort
                     street = lines[max(0, idx - 1)]
                 s_street, s_city, s_state, s_zip = parse_address(f"{street}, {city}, {state} {zip_code}")
-                dealers.append({
-                    "name": name,
-                    "street": s_street or street,
-                    "city": s_city or city,
-                    "state": (s_state or state).upper(),
-                    "zip": s_zip or zip_code,
-                    "phone": phone,
-                    "website": page_url,
-                })
+                dealers.append(_dealer_row(
+                    name, s_street or street, s_city or city, (s_state or state).upper(),
+                    s_zip or zip_code, phone, page_url,
+                ))
         return dealers
 
     def _extract_heading_address_blocks(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
@@ -310,8 +418,6 @@ class GenericDealerStrategy(ScraperStrategy):
         search_start = section_root.parent if section_root and section_root.parent else (section_root or soup)
 
         headings = search_start.find_all(["h2", "h3", "h4", "h5"], recursive=True)
-        phone_pattern = re.compile(r"\(??\d{3}\)??[\-\.\s]?\d{3}[\-\.\s]?\d{4}")
-        city_state_zip_pattern = re.compile(r"([^,\n]+),\s*([A-Z]{2})\s*(\d{5})(?:-\d{4})?")
 
         for h in headings:
             name = h.get_text(" ", strip=True)
@@ -327,56 +433,47 @@ class GenericDealerStrategy(ScraperStrategy):
             
             name_lower = name.lower()
             if any(nav_term in name_lower for nav_term in navigation_terms):
-                self.logger.debug(f"DEBUG: Rejected navigation heading: {name}")
+                self.logger.debug("DEBUG: Rejected navigation heading: %s", name)
                 continue
             # Collect small following sibling texts up to next heading
-            texts: list[str] = []
+            lines: List[str] = []
             nxt = h.next_sibling
             hops = 0
             while nxt and hops < 8:
                 if getattr(nxt, "name", None) in ["h1", "h2", "h3", "h4", "h5", "h6"]:
                     break
-                if hasattr(nxt, "get_text"):
-                    t = nxt.get_text("\n", strip=True)
-                    if t:
-                        texts.append(t)
+                if hasattr(nxt, "stripped_strings"):
+                    lines.extend(_text_lines(nxt))
                 nxt = nxt.next_sibling
                 hops += 1
-            blob = "\n".join(texts)
-            if not blob:
+            if not lines:
                 continue
             # Find address and phone
             street = city = state = zip_code = phone = ""
-            lines = [ln.strip() for ln in blob.split("\n") if ln.strip()]
             for idx, ln in enumerate(lines):
-                m = city_state_zip_pattern.search(ln)
+                m = _BLOCK_CITY_STATE_ZIP_RE.search(ln)
                 if m:
                     city, state, zip_code = m.groups()
                     if idx > 0:
                         street = lines[idx - 1]
                     break
             for ln in lines:
-                pm = phone_pattern.search(ln)
+                pm = _BLOCK_PHONE_RE.search(ln)
                 if pm:
                     phone = pm.group(0)
                     break
             if city and state:
                 s_street, s_city, s_state, s_zip = parse_address(f"{street}, {city}, {state} {zip_code}")
-                dealers.append({
-                    "name": name,
-                    "street": s_street or street,
-                    "city": s_city or city,
-                    "state": (s_state or state).upper(),
-                    "zip": s_zip or zip_code,
-                    "phone": phone,
-                    "website": page_url,
-                })
+                dealers.append(_dealer_row(
+                    name, s_street or street, s_city or city, (s_state or state).upper(),
+                    s_zip or zip_code, phone, page_url,
+                ))
         return dealers
     
-    def _extract_hgreg_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_hgreg_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract HGreg-specific dealers."""
         dealers = []
-        for card in soup.select("div.car-details"):
+        for card in cards:
             name_el = card.select_one("h2 a")
             address_el = card.select_one("p.extra-details.address")
             
@@ -387,21 +484,13 @@ class GenericDealerStrategy(ScraperStrategy):
             street, city, state, zip_code = parse_address(address)
             
             if name:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": "",
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, "", website))
         return dealers
     
-    def _extract_ken_ganley_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_ken_ganley_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract Ken Ganley-specific dealers."""
         dealers = []
-        for card in soup.select("div.panel.panel-default"):
+        for card in cards:
             name_el = card.select_one("h4.margin-bottom-x > strong")
             address_el = card.select_one("div.panel-body > p")
             
@@ -410,7 +499,7 @@ class GenericDealerStrategy(ScraperStrategy):
             for p in card.select("div.tab-pane.active p"):
                 if "Sales Phone" in p.get_text():
                     phone_text = p.get_text(" ", strip=True)
-                    phone_match = re.search(r"Sales Phone:\s*(\d[\d-]+)", phone_text)
+                    phone_match = _SALES_PHONE_RE.search(phone_text)
                     if phone_match:
                         phone = phone_match.group(1)
                     break
@@ -428,21 +517,13 @@ class GenericDealerStrategy(ScraperStrategy):
             street, city, state, zip_code = parse_address(address)
             
             if name:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, website))
         return dealers
     
-    def _extract_group1_subpage_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_group1_subpage_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract Group 1 subpage dealers."""
         dealers = []
-        for card in soup.select("div.location.dealer"):
+        for card in cards:
             name_el = card.select_one("h3.af-brand-text")
             p_tags = card.find_all("p")
             
@@ -451,7 +532,7 @@ class GenericDealerStrategy(ScraperStrategy):
             
             city, state, zip_code = "", "", ""
             if len(p_tags) > 1:
-                city_match = re.match(r"([\w\s\.-]+),\s*([A-Z]{2})\s*(\d{5})", p_tags[1].get_text(strip=True))
+                city_match = _GROUP1_CITY_LINE_RE.match(p_tags[1].get_text(strip=True))
                 if city_match:
                     city, state, zip_code = city_match.groups()
             
@@ -464,21 +545,13 @@ class GenericDealerStrategy(ScraperStrategy):
                     break
             
             if name:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, website))
         return dealers
     
-    def _extract_sierra_auto_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_sierra_auto_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract Sierra Auto Group dealers."""
         dealers = []
-        for card in soup.select("div.dealerInfo"):
+        for card in cards:
             name_el = card.select_one("h2.dealerBrand")
             address1_el = card.select_one("div.dealerAddress1")
             address2_el = card.select_one("div.dealerAddress2")
@@ -495,21 +568,13 @@ class GenericDealerStrategy(ScraperStrategy):
             street, city, state, zip_code = parse_address(full_address)
             
             if name and full_address:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, website))
         return dealers
     
-    def _extract_gregory_auto_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_gregory_auto_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract Gregory Auto Group dealers."""
         dealers = []
-        for card in soup.select("div.fusion-layout-column"):
+        for card in cards:
             name_el = card.select_one("h4.fusion-title-heading")
             text_el = card.select_one("div.fusion-text")
             
@@ -528,14 +593,14 @@ class GenericDealerStrategy(ScraperStrategy):
                     
                     for line in lines[1:]:
                         # Check for city, state, zip
-                        city_match = re.match(r"^([^,]+),\s*([A-Z]{2})\s+(\d{5})$", line.strip())
+                        city_match = _GREGORY_CITY_LINE_RE.match(line.strip())
                         if city_match:
                             city, state, zip_code = city_match.groups()
                             continue
                         
                         # Check for phone
                         if "call:" in line.lower():
-                            phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', line)
+                            phone_match = _PHONE_RE.search(line)
                             if phone_match:
                                 phone = phone_match.group()
             
@@ -546,21 +611,13 @@ class GenericDealerStrategy(ScraperStrategy):
                     break
             
             if name:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, website))
         return dealers
     
-    def _extract_carwash_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_carwash_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract car wash site dealers."""
         dealers = []
-        for card in soup.select("div.card.border-0"):
+        for card in cards:
             item_card = card.select_one("div.item-card9")
             if not item_card:
                 continue
@@ -584,21 +641,13 @@ class GenericDealerStrategy(ScraperStrategy):
             street, city, state, zip_code = parse_address(address)
             
             if name and address:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, website))
         return dealers
     
-    def _extract_open_road_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_open_road_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract Open Road dealers."""
         dealers = []
-        for card in soup.select("li.location-result"):
+        for card in cards:
             name_el = card.select_one("h2.name")
             address_el = card.select_one("div.address")
             
@@ -608,21 +657,13 @@ class GenericDealerStrategy(ScraperStrategy):
             street, city, state, zip_code = parse_address(address)
             
             if name and address:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": "",
-                    "website": page_url
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, "", page_url))
         return dealers
     
-    def _extract_all_american_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_all_american_dealers(self, cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract All American Auto Group dealers."""
         dealers = []
-        for h3 in soup.select("h3.h4"):
+        for h3 in cards:
             h3_text = h3.get_text(strip=True)
             if not h3_text or "all american" not in h3_text.lower():
                 continue
@@ -634,15 +675,22 @@ class GenericDealerStrategy(ScraperStrategy):
             # Look for address in following p element
             p_element = h3.find_next_sibling("p")
             if p_element:
-                p_html = str(p_element)
-                address_lines = re.split(r'<br\s*/?>', p_html)
-                address_lines = [re.sub(r'<[^>]+>', '', line).strip() for line in address_lines if line.strip()]
+                # Split the paragraph on <br> tags using the parsed nodes
+                address_lines, buf = [], []
+                for node in p_element.descendants:
+                    if node.name == "br":
+                        address_lines.append("".join(buf).strip())
+                        buf = []
+                    elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+                        buf.append(str(node))
+                address_lines.append("".join(buf).strip())
+                address_lines = [line for line in address_lines if line]
                 
                 if len(address_lines) >= 2:
                     street = address_lines[0]
                     city_state_zip = address_lines[1]
                     
-                    match = re.match(r"^(.+?),\s*([A-Z]{2}),?\s*(\d{5})$", city_state_zip.strip())
+                    match = _ALL_AMERICAN_CITY_LINE_RE.match(city_state_zip.strip())
                     if match:
                         city, state, zip_code = match.groups()
             
@@ -657,23 +705,16 @@ class GenericDealerStrategy(ScraperStrategy):
                 website = a_element["href"]
             
             if name and street:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": "",
-                    "website": website
-                })
+                dealers.append(_dealer_row(name, street, city, state, zip_code, "", website))
         return dealers
     
-    def _extract_autobell_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
-        """Extract AutoBell dealers."""
+    def _extract_autobell_dealers(self, spans: List[Tag], page_url: str) -> List[Dict[str, Any]]:
+        """Extract AutoBell dealers from the spans inside <h2> headings."""
         dealers = []
-        for h2 in soup.find_all("h2"):
-            span = h2.find("span")
-            if not span or "miles away" not in span.get_text():
+        for span in spans:
+            h2 = span.find_parent("h2")
+            # A heading is read from its first span only, which gives the distance
+            if h2.find("span") is not span or "miles away" not in span.get_text():
                 continue
             
             street = h2.get_text(separator=" ", strip=True).split(" miles away")[0]
@@ -681,32 +722,30 @@ class GenericDealerStrategy(ScraperStrategy):
             
             city, state, zip_code = "", "", ""
             if address_el:
-                address_lines = address_el.decode_contents().split("<br>")
+                # Split the address on <br> tags using the parsed nodes
+                address_lines = [[]]
+                for node in address_el.descendants:
+                    if node.name == "br":
+                        address_lines.append([])
+                    elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+                        text = node.strip()
+                        if text:
+                            address_lines[-1].append(text)
                 if len(address_lines) == 2:
-                    city_state_zip = BeautifulSoup(address_lines[1], "html.parser").get_text(" ", strip=True)
-                    match = re.match(r"(.+),\s*([A-Z]{2})\s*(\d{5})", city_state_zip)
+                    city_state_zip = " ".join(address_lines[1])
+                    match = _AUTOBELL_CITY_LINE_RE.match(city_state_zip)
                     if match:
                         city, state, zip_code = match.groups()
             
             if street:
-                dealers.append({
-                    "name": street,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": "",
-                    "website": page_url
-                })
+                dealers.append(_dealer_row(street, street, city, state, zip_code, "", page_url))
         return dealers
     
-    def _extract_bakhtiari_style_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_bakhtiari_style_dealers(self, dealer_cards: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Bakhtiari-style location pages with location cards."""
         dealers = []
         
-        # Look for Bakhtiari-style dealer cards
-        dealer_cards = soup.find_all('div', class_=lambda x: x and 'location' in x and 'bg-main' in x)
-        self.logger.debug(f"DEBUG: _extract_bakhtiari_style_dealers found {len(dealer_cards)} location cards")
+        self.logger.debug("DEBUG: _extract_bakhtiari_style_dealers found %d location cards", len(dealer_cards))
         
         if not dealer_cards:
             return dealers
@@ -720,14 +759,28 @@ class GenericDealerStrategy(ScraperStrategy):
             phone = ""
             website = page_url
             
+            # One walk over the card collects the name span, the first h6 and p.larger elements
+            name_el = None
+            heading_el = None
+            p_elements = []
+            for el in card.descendants:
+                tag = el.name
+                if tag == 'p':
+                    if 'larger' in el.get('class', ()):
+                        p_elements.append(el)
+                elif tag == 'span':
+                    if name_el is None and " ".join(el.get('class', ())) == 'h1 text-uppercase':
+                        name_el = el
+                elif tag == 'h6' and heading_el is None:
+                    heading_el = el
+            
             # Extract dealer name from span.h1.text-uppercase
-            name_el = card.find('span', class_='h1 text-uppercase')
             if name_el:
                 name = name_el.get_text(strip=True)
                 
             # If no name found, try h6 > span
             if not name:
-                name_el = card.find('h6')
+                name_el = heading_el
                 if name_el:
                     name_parts = []
                     span_el = name_el.find('span', class_='h1 text-uppercase')
@@ -742,74 +795,51 @@ class GenericDealerStrategy(ScraperStrategy):
                     name = " ".join(name_parts)
             
             # Extract address from p.larger elements
-            p_elements = card.find_all('p', class_='larger')
-            self.logger.debug(f"DEBUG: Bakhtiari card found {len(p_elements)} p.larger elements")
+            self.logger.debug("DEBUG: Bakhtiari card found %d p.larger elements", len(p_elements))
             
             for p in p_elements:
-                p_text = p.get_text('\n', strip=True)
-                self.logger.debug(f"DEBUG: Bakhtiari p_text: '{p_text}'")
+                p_text = _paragraph_text(p)
+                self.logger.debug("DEBUG: Bakhtiari p_text: '%s'", p_text)
                 
-                # Check if this paragraph contains a phone number
-                phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', p_text)
-                if phone_match:
-                    phone = phone_match.group(0)
-                    self.logger.debug(f"DEBUG: Bakhtiari found phone: {phone}")
+                p_phone, p_street, p_city, p_state, p_zip = _classify_card_paragraph(p_text)
+                if p_phone:
+                    phone = p_phone
+                    self.logger.debug("DEBUG: Bakhtiari found phone: %s", phone)
                     continue
                 
-                # Check if this paragraph contains an address
                 # Address format: "6511 Santa Monica Blvd\nLos Angeles, CA 90038"
-                address_keywords = ['blvd', 'street', 'road', 'ave', 'dr', 'freeway', 'fwy', 'pkwy', 'ste', 'suite', 'way', 'ln', 'lane', 'ct', 'court', 'pl', 'place', 'hwy', 'st', 'rd', 'ave', 'drive', 'main', 'hill', 'kansas']
-                if not phone_match and any(keyword in p_text.lower() for keyword in address_keywords):
-                    lines = [line.strip() for line in p_text.split('\n') if line.strip()]
-                    self.logger.debug(f"DEBUG: Bakhtiari address paragraph has {len(lines)} lines: {lines}")
-                    
-                    if len(lines) >= 2:
-                        # First line is street
-                        street = lines[0]
-                        
-                        # Second line is city, state, zip
-                        # Handle both "Los Angeles, CA 90038" and "Los Angeles CA 90038" formats
-                        city_line = lines[1]
-                        city_match = re.match(r'([^,]+),?\s*([A-Z]{2})\s*(\d{5})', city_line)
-                        if city_match:
-                            city, state, zip_code = city_match.groups()
-                            self.logger.debug(f"DEBUG: Bakhtiari parsed address - street='{street}', city='{city}', state='{state}'")
+                if p_street:
+                    street = p_street
+                if p_city:
+                    city, state, zip_code = p_city, p_state, p_zip
+                    self.logger.debug("DEBUG: Bakhtiari parsed address - street='%s', city='%s', state='%s'", street, city, state)
             
             # If we got basic info, add the dealer
-            self.logger.debug(f"DEBUG: Bakhtiari processed - name='{name}', street='{street}', city='{city}'")
+            self.logger.debug("DEBUG: Bakhtiari processed - name='%s', street='%s', city='%s'", name, street, city)
             if name and street:
-                self.logger.debug(f"DEBUG: Adding Bakhtiari dealer: {name}")
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": page_url
-                })
+                self.logger.debug("DEBUG: Adding Bakhtiari dealer: %s", name)
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, page_url))
             else:
-                self.logger.debug(f"DEBUG: Skipping Bakhtiari card - missing name or street")
+                self.logger.debug("DEBUG: Skipping Bakhtiari card - missing name or street")
         
         return dealers
     
-    def _extract_colonial_style_dealers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+    def _extract_colonial_style_dealers(self, dealer_divs: List[Tag], page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Colonial Auto Group style pages."""
         dealers = []
         
-        # Find all div elements with class 'get-direction__dealer-name' containing Colonial dealers
-        dealer_divs = soup.find_all('div', class_='get-direction__dealer-name')
+        # Keep the 'get-direction__dealer-name' divs that name a Colonial dealer
         colonial_divs = []
         
         for div in dealer_divs:
             if 'colonial' in div.get_text().lower():
                 colonial_divs.append(div)
         
-        self.logger.debug(f"DEBUG: _extract_colonial_style_dealers found {len(colonial_divs)} dealer divs")
+        self.logger.debug("DEBUG: _extract_colonial_style_dealers found %d dealer divs", len(colonial_divs))
         
         for div in colonial_divs:
             name = div.get_text().strip()
-            self.logger.debug(f"DEBUG: Processing Colonial dealer: {name}")
+            self.logger.debug("DEBUG: Processing Colonial dealer: %s", name)
             
             # Look for address and phone information in the next sibling divs
             street = ""
@@ -823,53 +853,32 @@ class GenericDealerStrategy(ScraperStrategy):
             # <div>201 Cambridge Rd, Woburn, MA 01801</div>
             # <div>(888) 755-1359</div>
             
-            current = div.next_sibling
-            siblings_checked = 0
-            
-            while current and siblings_checked < 10:  # Look at next few siblings
+            for current in islice(div.next_siblings, 10):  # Look at next few siblings
                 if hasattr(current, 'get_text'):
                     text = current.get_text().strip()
-                    self.logger.debug(f"DEBUG: Colonial sibling text: '{text}'")
+                    self.logger.debug("DEBUG: Colonial sibling text: '%s'", text)
                     
                     if text:  # Non-empty text
                         # Check for phone number
-                        phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+                        phone_match = _PHONE_RE.search(text)
                         if phone_match and not phone:
                             phone = phone_match.group(0)
-                            self.logger.debug(f"DEBUG: Found Colonial phone: {phone}")
+                            self.logger.debug("DEBUG: Found Colonial phone: %s", phone)
                         
                         # Check for address pattern (street + city, state zip)
                         elif not street and ',' in text:
-                            # Try to parse full address: "201 Cambridge Rd, Woburn, MA 01801"
-                            parts = text.split(',')
-                            if len(parts) >= 2:
-                                potential_street = parts[0].strip()
-                                remaining = ','.join(parts[1:]).strip()
-                                
-                                # Check if remaining part matches city, state zip
-                                city_match = re.match(r'^([^,]+?)\s+([A-Z]{2})\s+(\d{5})$', remaining)
-                                if city_match:
-                                    street = potential_street
-                                    city, state, zip_code = city_match.groups()
-                                    self.logger.debug(f"DEBUG: Found Colonial address - street='{street}', city='{city}', state='{state}', zip='{zip_code}'")
-                    
-                    siblings_checked += 1
-                
-                current = current.next_sibling
+                            # Parse the full address in one match: "201 Cambridge Rd, Woburn MA 01801"
+                            address_match = _COLONIAL_ADDRESS_RE.match(text)
+                            if address_match:
+                                street = address_match.group(1).strip()
+                                city, state, zip_code = address_match.group(2, 3, 4)
+                                self.logger.debug("DEBUG: Found Colonial address - street='%s', city='%s', state='%s', zip='%s'", street, city, state, zip_code)
             
             # Only add if we have basic required info
             if name and street and city and state:
-                dealers.append({
-                    "name": name,
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zip": zip_code,
-                    "phone": phone,
-                    "website": page_url
-                })
-                self.logger.debug(f"DEBUG: Added Colonial dealer: {name} at {street}")
+                dealers.append(_dealer_row(name, street, city, state, zip_code, phone, page_url))
+                self.logger.debug("DEBUG: Added Colonial dealer: %s at %s", name, street)
             else:
-                self.logger.debug(f"DEBUG: Skipping Colonial dealer - missing info: name={bool(name)}, street={bool(street)}, city={bool(city)}, state={bool(state)}")
+                self.logger.debug("DEBUG: Skipping Colonial dealer - missing info: name=%s, street=%s, city=%s, state=%s", bool(name), bool(street), bool(city), bool(state))
         
         return dealers
\ No newline at end of file
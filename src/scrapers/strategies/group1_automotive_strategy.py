@@ -7,23 +7,120 @@ Group 1 Automotive dealer location pages.
 
 from typing import List, Dict, Any
 import re
-import sys
-from bs4 import BeautifulSoup
+import logging
+from functools import lru_cache, partial
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..base_scraper import ScraperStrategy
 from ...utils.address_parser import parse_address
+from ...utils.parse_cache import LastParseCache
+
+
+def _is_listing_class(class_value) -> bool:
+    """Whether a class attribute value has the listing class among its tokens."""
+    return class_value is not None and "dealerResults__listing" in class_value.split()
+
+
+# Only the listing cards are read, both to detect the page and to extract from it.
+# The strainer sees the whole class string, so the listing class is matched per token.
+_LISTING_STRAINER = SoupStrainer("div", class_=_is_listing_class)
+
+# "Street, City, State [ZIP]"
+_FALLBACK_ADDR_RE = re.compile(r"(.+),\s*(.+?),\s*([A-Za-z\.\s]+?)(?:\s+(\d{5}))?$")
+
+_BRAND_KEYWORDS = (
+    "Toyota", "Honda", "Ford", "Chevrolet", "Chevy", "Nissan", "BMW", "Mercedes",
+    "Audi", "Volkswagen", "VW", "Subaru", "Mazda", "Hyundai", "Kia", "Lexus",
+    "Acura", "Infiniti", "Volvo", "Jaguar", "Land Rover", "Porsche", "Cadillac",
+    "Buick", "GMC", "Dodge", "Chrysler", "Jeep", "Ram", "Lincoln", "Genesis"
+)
+_BRAND_BY_UPPER = {brand.upper(): brand for brand in _BRAND_KEYWORDS}
+# Every brand occurrence in one pass; the lookahead lets overlapping names both match
+_BRAND_RE = re.compile(
+    "(?=(" + "|".join(re.escape(brand) for brand in _BRAND_KEYWORDS) + "))", re.IGNORECASE
+)
+
+_STATE_LOOKUP = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
+    "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE",
+    "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID",
+    "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS",
+    "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
+    "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS",
+    "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV",
+    "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
+    "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK",
+    "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
+    "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT",
+    "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV",
+    "WISCONSIN": "WI", "WYOMING": "WY",
+    # DC and territories
+    "DISTRICT OF COLUMBIA": "DC", "WASHINGTON DC": "DC", "DC": "DC",
+}
+
+# Common city names that might be multi-word
+_MULTI_WORD_CITIES = frozenset({
+    "Clear Lake", "Sugar Land", "Round Rock", "El Paso", "Santa Fe",
+    "Newport Beach", "Beverly Hills", "Panama City", "Rock Hill",
+    "Rockville Centre", "Landover Hills",
+})
+
+
+class _PhoneCharTable(dict):
+    """str.translate table that keeps phone number characters and deletes the rest.
+
+    Entries are filled in the first time each character is seen, which lets
+    the table keep any Unicode decimal digit or whitespace character.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isdecimal() or char.isspace() or char in "-()+"
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+_PHONE_CHARS = _PhoneCharTable()
+
+
+def _normalize_state(state_str: str) -> str:
+    """Normalize a state name or abbreviation to its 2-letter code."""
+    cleaned = (state_str or "").strip().upper().rstrip(".")
+    if len(cleaned) == 2 and cleaned.isalpha():
+        return cleaned
+    return _STATE_LOOKUP.get(cleaned, cleaned[:2])  # fallback to first 2 letters
+
+
+def _strip_country_and_period(text: str) -> str:
+    """Remove a trailing ", USA" and period."""
+    t = (text or "").strip()
+    t = t.rstrip(".")
+    if t.upper().endswith(", USA"):
+        t = t[:-5].rstrip()
+    elif t.upper().endswith("USA"):
+        t = t[:-3].rstrip().rstrip(",")
+    return t
 
 
 class Group1AutomotiveStrategy(ScraperStrategy):
     """Extracts dealer data from Group 1 Automotive HTML structure."""
     
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # Listings-only parse, shared by can_handle and extract_dealers
+        self._parse = LastParseCache(partial(BeautifulSoup, features="lxml", parse_only=_LISTING_STRAINER))
+    
     @property
     def strategy_name(self) -> str:
         return "Group 1 Automotive HTML"
     
     def can_handle(self, html: str, page_url: str) -> bool:
         """Check if page contains Group 1 Automotive structure."""
-        soup = BeautifulSoup(html, "html.parser")
+        # Without the listing class name anywhere there is nothing to parse for
+        if "dealerResults__listing" not in html:
+            return False
+
+        soup = self._parse(html)
         
         # Look for Group 1 specific indicators (updated selectors)
         group1_indicators = soup.select("div.dealerResults__listing")
@@ -39,7 +136,7 @@ class Group1AutomotiveStrategy(ScraperStrategy):
     
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Group 1 Automotive HTML structure."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         dealers = []
         
         # Extract from Group 1 listing elements
@@ -48,7 +145,7 @@ class Group1AutomotiveStrategy(ScraperStrategy):
             if dealer:
                 dealers.append(dealer)
         
-        print(f"DEBUG: Group 1 Automotive strategy extracted {len(dealers)} dealers", file=sys.stderr)
+        self.logger.debug("DEBUG: Group 1 Automotive strategy extracted %d dealers", len(dealers))
         return dealers
     
     def _extract_dealer_from_listing(self, listing, page_url: str) -> Dict[str, Any]:
@@ -58,9 +155,10 @@ class Group1AutomotiveStrategy(ScraperStrategy):
             name_el = listing.select_one(".dealerResults__listing--name")
             name = name_el.get_text(strip=True) if name_el else ""
             
-            # Debug: Print when name extraction fails
+            # Debug: Log when name extraction fails; serializing the listing is costly
             if not name:
-                print(f"DEBUG: Name extraction failed for listing with HTML: {str(listing)[:200]}...", file=sys.stderr)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("DEBUG: Name extraction failed for listing with HTML: %s...", str(listing)[:200])
                 return None
             
             # Extract address
@@ -92,8 +190,10 @@ class Group1AutomotiveStrategy(ScraperStrategy):
             # Parse address into components using the old method for now
             street, city, state, zip_code = self._parse_address_components(address)
             
-            # Debug: Print parsed components
-            print(f"DEBUG: Address '{address}' -> Street: '{street}', City: '{city}', State: '{state}', Zip: '{zip_code}'", file=sys.stderr)
+            self.logger.debug(
+                "DEBUG: Address '%s' -> Street: '%s', City: '%s', State: '%s', Zip: '%s'",
+                address, street, city, state, zip_code,
+            )
             
             return {
                 "Name": str(name).strip(),
@@ -102,62 +202,33 @@ class Group1AutomotiveStrategy(ScraperStrategy):
                 "State": str(state).strip(),
                 "Zip": str(zip_code).strip(),
                 "Country": "USA",
-                "Phone": re.sub(r"[^\d\-\(\)\s\+]", "", str(phone)).strip(),
+                "Phone": str(phone).translate(_PHONE_CHARS).strip(),
                 "Website": str(website).strip() if website else page_url,
                 "DealerType": "New Car Dealer",
                 "CarBrands": ", ".join(self._extract_brands_from_text(name))
             }
             
         except Exception as e:
-            print(f"DEBUG: Error extracting dealer from Group 1 listing: {e}", file=sys.stderr)
+            self.logger.debug("DEBUG: Error extracting dealer from Group 1 listing: %s", e)
             return None
     
-    def _parse_address_components(self, address: str) -> tuple:
+    # Memoized like utils.address_parser.parse_address: chains repeat the same
+    # address strings across listings and re-scrapes. A staticmethod so the
+    # cache is keyed on the address alone rather than holding on to instances.
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_address_components(address: str) -> tuple:
         """Parse address string into components."""
         if not address:
             return "", "", "", ""
         
-        # Helper: normalize state to 2-letter code
-        def normalize_state(state_str: str) -> str:
-            state_lookup = {
-                "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
-                "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE",
-                "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID",
-                "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS",
-                "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
-                "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS",
-                "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV",
-                "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
-                "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK",
-                "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
-                "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT",
-                "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV",
-                "WISCONSIN": "WI", "WYOMING": "WY",
-                # DC and territories
-                "DISTRICT OF COLUMBIA": "DC", "WASHINGTON DC": "DC", "DC": "DC",
-            }
-            cleaned = (state_str or "").strip().upper().rstrip(".")
-            if len(cleaned) == 2 and cleaned.isalpha():
-                return cleaned
-            return state_lookup.get(cleaned, cleaned[:2])  # fallback to first 2 letters
-
-        # Helper: remove trailing ", USA" and period
-        def strip_country_and_period(text: str) -> str:
-            t = (text or "").strip()
-            t = t.rstrip(".")
-            if t.upper().endswith(", USA"):
-                t = t[:-5].rstrip()
-            elif t.upper().endswith("USA"):
-                t = t[:-3].rstrip().rstrip(",")
-            return t
-
         # Group 1 format variations: 
         # "Street | City, State ZIP" OR "Street, City | State ZIP"
         if "|" in address:
             parts = address.split("|")
             if len(parts) == 2:
                 left_part = parts[0].strip()
-                right_part = strip_country_and_period(parts[1])
+                right_part = _strip_country_and_period(parts[1])
 
                 # Case 1: "Street | City, State [ZIP]"
                 if "," in right_part:
@@ -174,17 +245,17 @@ class Group1AutomotiveStrategy(ScraperStrategy):
                                 state_token = " ".join(tokens[:-1])
                             else:
                                 state_token = " ".join(tokens)
-                        state_abbr = normalize_state(state_token)
+                        state_abbr = _normalize_state(state_token)
                         return left_part, city, state_abbr, zip_code
 
                 # Case 2: "Street, City | State [ZIP]"
                 if "," in left_part:
-                    street_city = left_part.split(",")
-                    if len(street_city) == 2:
-                        street = street_city[0].strip()
-                        city = street_city[1].strip()
+                    street, _, city = left_part.partition(",")
+                    if "," not in city:
+                        street = street.strip()
+                        city = city.strip()
 
-                        right_clean = strip_country_and_period(right_part)
+                        right_clean = _strip_country_and_period(right_part)
                         tokens = right_clean.split()
                         zip_code = ""
                         state_token = ""
@@ -194,21 +265,22 @@ class Group1AutomotiveStrategy(ScraperStrategy):
                                 state_token = " ".join(tokens[:-1])
                             else:
                                 state_token = " ".join(tokens)
-                        state_abbr = normalize_state(state_token)
+                        state_abbr = _normalize_state(state_token)
                         return street, city, state_abbr, zip_code
         
         # Fallback: "Street, City, State [ZIP][, USA]"
-        addr_clean = strip_country_and_period(address)
-        match = re.match(r"(.+),\s*(.+?),\s*([A-Za-z\.\s]+?)(?:\s+(\d{5}))?$", addr_clean)
+        addr_clean = _strip_country_and_period(address)
+        match = _FALLBACK_ADDR_RE.match(addr_clean)
         if match:
             street = match.group(1).strip()
             city = match.group(2).strip()
-            state_abbr = normalize_state(match.group(3))
+            state_abbr = _normalize_state(match.group(3))
             zip_code = (match.group(4) or "").strip()
             return street, city, state_abbr, zip_code
         
         # Handle single comma format: "Street City, State ZIP" (no comma between street and city)
-        parts = addr_clean.split(",")
+        # Only the first three pieces are read, so the tail is never split further
+        parts = addr_clean.split(",", 3)
         if len(parts) == 2:
             left_part = parts[0].strip()  # "15943 Gulf Freeway Webster"
             right_part = parts[1].strip()  # "TX 77598" or "Texas 77598" or "CA"
@@ -220,25 +292,18 @@ class Group1AutomotiveStrategy(ScraperStrategy):
             if tokens:
                 if tokens[-1].isdigit() and len(tokens[-1]) == 5:
                     zip_code = tokens[-1]
-                    state = normalize_state(" ".join(tokens[:-1]))
+                    state = _normalize_state(" ".join(tokens[:-1]))
                 else:
-                    state = normalize_state(" ".join(tokens))
+                    state = _normalize_state(" ".join(tokens))
                 
                 # Split left part by spaces to separate street from city
                 # For addresses like "15943 Gulf Freeway Webster", we need to detect where street ends and city begins
                 words = left_part.split()
                 if len(words) >= 2:
-                    # Common city names that might be multi-word
-                    multi_word_cities = [
-                        "Clear Lake", "Sugar Land", "Round Rock", "El Paso", "Santa Fe", 
-                        "Newport Beach", "Beverly Hills", "Panama City", "Rock Hill",
-                        "Rockville Centre", "Landover Hills"
-                    ]
-                    
                     # Check if last 2 words form a known multi-word city
                     if len(words) >= 3:
                         potential_city = " ".join(words[-2:])
-                        if potential_city in multi_word_cities:
+                        if potential_city in _MULTI_WORD_CITIES:
                             street = " ".join(words[:-2])
                             city = potential_city
                             return street, city, state, zip_code
@@ -259,26 +324,14 @@ class Group1AutomotiveStrategy(ScraperStrategy):
             if state_zip_tokens:
                 if state_zip_tokens[-1].isdigit() and len(state_zip_tokens[-1]) == 5:
                     zip_code = state_zip_tokens[-1]
-                    state = normalize_state(" ".join(state_zip_tokens[:-1]))
+                    state = _normalize_state(" ".join(state_zip_tokens[:-1]))
                 else:
-                    state = normalize_state(" ".join(state_zip_tokens))
+                    state = _normalize_state(" ".join(state_zip_tokens))
             return street, city, state, zip_code
         
         return address, "", "", ""
     
     def _extract_brands_from_text(self, text: str) -> List[str]:
         """Extract car brands from dealer name."""
-        brands = []
-        brand_keywords = [
-            "Toyota", "Honda", "Ford", "Chevrolet", "Chevy", "Nissan", "BMW", "Mercedes",
-            "Audi", "Volkswagen", "VW", "Subaru", "Mazda", "Hyundai", "Kia", "Lexus",
-            "Acura", "Infiniti", "Volvo", "Jaguar", "Land Rover", "Porsche", "Cadillac",
-            "Buick", "GMC", "Dodge", "Chrysler", "Jeep", "Ram", "Lincoln", "Genesis"
-        ]
-        
-        text_upper = text.upper()
-        for brand in brand_keywords:
-            if brand.upper() in text_upper:
-                brands.append(brand)
-        
-        return brands
\ No newline at end of file
+        found = {_BRAND_BY_UPPER[m.group(1).upper()] for m in _BRAND_RE.finditer(text)}
+        return [brand for brand in _BRAND_KEYWORDS if brand in found]
\ No newline at end of file
@@ -6,12 +6,55 @@ commonly used to store location data on dealer websites.
 """
 
 from typing import List, Dict, Any
+import base64
 import json
+import logging
 import re
 import sys
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..base_scraper import ScraperStrategy
+from ...utils.json_loader import loads_json
+
+logger = logging.getLogger(__name__)
+
+
+# Openings of the JavaScript location arrays
+_LOCATION_ARRAY_OPENINGS = (
+    r"(?:var|let|const)\s+(?:locations|dealers|stores)\s*=\s*\[",
+    r"window\.dealerData\s*=\s*\[",
+    r"locationData:\s*\[",
+)
+_LOCATION_ARRAY_OPENING_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _LOCATION_ARRAY_OPENINGS), re.IGNORECASE
+)
+# Common patterns in JavaScript that mark a page as carrying location data,
+# joined into one alternation so the page is scanned once
+_LOCATION_DATA_MARKER_RE = re.compile("|".join(f"(?:{pattern})" for pattern in _LOCATION_ARRAY_OPENINGS + (
+    r"agile-store-locator",  # Agile Store Locator plugin
+    r"ASL_REMOTE.*ajax_url",  # ASL AJAX configuration
+)), re.IGNORECASE)
+
+# JavaScript variable patterns to search for
+_LOCATION_ARRAY_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r"(?:var|let|const)\s+(?:locations|dealers|stores)\s*=\s*(\[.*?\]);",
+    r"window\.dealerData\s*=\s*(\[.*?\]);",
+    r"locationData:\s*(\[.*?\])",
+))
+# Location arrays only ever live in inline scripts
+_SCRIPT_STRAINER = SoupStrainer("script")
+
+# Direct ASL configuration
+_ASL_AJAX_URL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'var ASL_REMOTE = \{[^}]*"ajax_url":"([^"]+)"',  # JSON format
+    r"ajax_url.*?[\"'](https?://[^\"']*admin-ajax\.php)[\"']",  # Generic admin-ajax pattern
+))
+_BASE64_SCRIPT_RE = re.compile(r'src="data:text/javascript;base64,([^"]+)"')
+_DECODED_AJAX_URL_RE = re.compile(r'"ajax_url":"([^"]+)"')
+# Failed ASL probes with a declared body up to this size are read so their
+# connection returns to the session's pool; larger or unsized ones are dropped
+_MAX_DRAINED_PROBE_BYTES = 64 * 1024
 
 
 class JavaScriptStrategy(ScraperStrategy):
@@ -23,24 +66,10 @@ class JavaScriptStrategy(ScraperStrategy):
     
     def can_handle(self, html: str, page_url: str) -> bool:
         """Check if page contains JavaScript variables with location data."""
-        # Look for common patterns in JavaScript
-        patterns = [
-            r"(?:var|let|const)\s+(?:locations|dealers|stores)\s*=\s*\[",
-            r"window\.dealerData\s*=\s*\[",
-            r"locationData:\s*\[",
-            r"agile-store-locator",  # Agile Store Locator plugin
-            r"ASL_REMOTE.*ajax_url",  # ASL AJAX configuration
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, html, re.IGNORECASE):
-                return True
-        
-        return False
+        return _LOCATION_DATA_MARKER_RE.search(html) is not None
     
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from JavaScript variables."""
-        soup = BeautifulSoup(html, "html.parser")
         dealers = []
         
         # Check for Agile Store Locator first
@@ -50,23 +79,22 @@ class JavaScriptStrategy(ScraperStrategy):
             if asl_dealers:
                 return asl_dealers
         
-        # JavaScript variable patterns to search for
-        patterns = [
-            r"(?:var|let|const)\s+(?:locations|dealers|stores)\s*=\s*(\[.*?\]);",
-            r"window\.dealerData\s*=\s*(\[.*?\]);",
-            r"locationData:\s*(\[.*?\])",
-        ]
+        # No script can hold a location array if no array opening appears on the page
+        if not _LOCATION_ARRAY_OPENING_RE.search(html):
+            logger.debug("No JavaScript location arrays on page")
+            return dealers
         
+        soup = BeautifulSoup(html, "lxml", parse_only=_SCRIPT_STRAINER)
         for script in soup.find_all("script"):
             script_text = script.string or ""
             
-            for pattern in patterns:
-                matches = re.finditer(pattern, script_text, re.DOTALL | re.IGNORECASE)
+            for pattern in _LOCATION_ARRAY_PATTERNS:
+                matches = pattern.finditer(script_text)
                 
                 for match in matches:
                     try:
                         json_str = match.group(1)
-                        data_array = json.loads(json_str)
+                        data_array = loads_json(json_str)
                         
                         if isinstance(data_array, list):
                             for item in data_array:
@@ -142,39 +170,33 @@ class JavaScriptStrategy(ScraperStrategy):
     
     def _extract_asl_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Agile Store Locator plugin data."""
-        import requests
-        import base64
-        from urllib.parse import urljoin
-        
         dealers = []
         ajax_url = None
         
         try:
             # First try to find direct ASL configuration
-            ajax_patterns = [
-                r'var ASL_REMOTE = \{[^}]*"ajax_url":"([^"]+)"',  # JSON format
-                r"ajax_url.*?[\"'](https?://[^\"']*admin-ajax\.php)[\"']",  # Generic admin-ajax pattern
-            ]
-            
-            for pattern in ajax_patterns:
-                ajax_match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
+            for pattern in _ASL_AJAX_URL_PATTERNS:
+                ajax_match = pattern.search(html)
                 if ajax_match:
                     ajax_url = ajax_match.group(1).replace('\/', '/')  # Unescape slashes
                     break
             
             # If not found, try to decode base64 encoded scripts
             if not ajax_url:
-                base64_pattern = r'src="data:text/javascript;base64,([^"]+)"'
-                base64_matches = re.findall(base64_pattern, html)
+                base64_matches = _BASE64_SCRIPT_RE.findall(html)
                 
                 for b64_data in base64_matches:
                     try:
                         # Decode base64
-                        decoded = base64.b64decode(b64_data + '==').decode('utf-8', errors='ignore')  # Add padding
+                        raw = base64.b64decode(b64_data + '==')  # Add padding
                         
-                        # Look for ASL_REMOTE in decoded content
+                        # Look for ASL_REMOTE in decoded content, only building
+                        # a str for the scripts that carry it
+                        if b'ASL_REMOTE' not in raw or b'ajax_url' not in raw:
+                            continue
+                        decoded = raw.decode('utf-8', errors='ignore')
                         if 'ASL_REMOTE' in decoded and 'ajax_url' in decoded:
-                            ajax_match = re.search(r'"ajax_url":"([^"]+)"', decoded)
+                            ajax_match = _DECODED_AJAX_URL_RE.search(decoded)
                             if ajax_match:
                                 ajax_url = ajax_match.group(1).replace('\/', '/')
                                 print(f"DEBUG: Found ASL AJAX URL in base64: {ajax_url}", file=sys.stderr)
@@ -190,35 +212,42 @@ class JavaScriptStrategy(ScraperStrategy):
                     # ASL typically uses these actions for loading stores
                     asl_actions = ['asl_load_stores', 'asl_stores_load', 'asl_load_store']
                     
-                    for action in asl_actions:
-                        response = requests.get(
-                            ajax_url,
-                            params={
-                                'action': action,
-                                'nonce': '',  # Try without nonce first
-                                'load_all': '1',  # Load all stores
-                                'lat': '',  # No location filter
-                                'lng': '',
-                                'distance': '100000',  # Large distance to get all
-                            },
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                                'Referer': page_url,
-                            },
-                            timeout=15
-                        )
-                        
-                        if response.status_code == 200:
-                            try:
-                                data = response.json()
-                                if data and len(str(data)) > 50:  # Has meaningful data
-                                    print(f"DEBUG: ASL AJAX success with action '{action}': {len(str(data))} characters", file=sys.stderr)
-                                    break
-                            except json.JSONDecodeError:
-                                continue
-                    else:
-                        print(f"DEBUG: All ASL AJAX actions failed", file=sys.stderr)
-                        return dealers
+                    # One session for all probes so they reuse a keep-alive connection
+                    with requests.Session() as session:
+                        session.headers.update({
+                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                            'Referer': page_url,
+                        })
+                        for action in asl_actions:
+                            # Streamed so a failed probe's body is only read when it is small
+                            with session.get(
+                                ajax_url,
+                                params={
+                                    'action': action,
+                                    'nonce': '',  # Try without nonce first
+                                    'load_all': '1',  # Load all stores
+                                    'lat': '',  # No location filter
+                                    'lng': '',
+                                    'distance': '100000',  # Large distance to get all
+                                },
+                                timeout=15,
+                                stream=True
+                            ) as response:
+                                if response.status_code != 200:
+                                    content_length = response.headers.get('Content-Length', '')
+                                    if content_length.isdigit() and int(content_length) <= _MAX_DRAINED_PROBE_BYTES:
+                                        response.content  # Drain so the keep-alive connection is reused
+                                    continue
+                                try:
+                                    data = loads_json(response.content)
+                                    if data and len(str(data)) > 50:  # Has meaningful data
+                                        print(f"DEBUG: ASL AJAX success with action '{action}': {len(str(data))} characters", file=sys.stderr)
+                                        break
+                                except json.JSONDecodeError:
+                                    continue
+                        else:
+                            print(f"DEBUG: All ASL AJAX actions failed", file=sys.stderr)
+                            return dealers
                     
                     # Process successful response
                     print(f"DEBUG: ASL AJAX response: {len(str(data))} characters", file=sys.stderr)
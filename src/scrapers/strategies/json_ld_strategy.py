@@ -5,44 +5,96 @@ This strategy extracts dealer information from JSON-LD structured data
 commonly found in automotive dealer websites.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import json
+import re
 import sys
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ..base_scraper import ScraperStrategy
+from ...utils.json_loader import loads_json
+from ...utils.parse_cache import LastParseCache
+
+
+# Entity types that can describe a dealer location
+_RELEVANT_TYPES = frozenset({"AutoDealer", "AutomotiveBusiness", "LocalBusiness"})
+
+# Name fragments that mark a corporate entry rather than a dealer location
+_CORPORATE_NAMES = (
+    "auto group", "automotive group", "group", "motors", "corporation", "corp",
+    "sales", "service", "parts", "department", "headquarters", "hq"
+)
+_CORPORATE_NAME_RE = re.compile("|".join(map(re.escape, _CORPORATE_NAMES)))
+
+# Corporate types that should be filtered out; matched as substrings of @type
+_CORPORATE_TYPES = (
+    "AutomotiveBusiness", "AutoDealer", "AutoRepair", "AutoBodyShop",
+    "Organization", "Corporation", "LocalBusiness"
+)
+_CORPORATE_TYPE_RE = re.compile("|".join(map(re.escape, _CORPORATE_TYPES)))
+
+
+class _JsonLdCollector:
+    """lxml parser target that keeps the text of JSON-LD scripts and builds no tree."""
+    
+    def __init__(self):
+        self.scripts: List[Optional[str]] = []
+        self._buffer: Optional[List[str]] = None
+    
+    def start(self, tag: str, attrib) -> None:
+        if tag == "script" and attrib.get("type") == "application/ld+json":
+            self._buffer = []
+    
+    def data(self, data: str) -> None:
+        if self._buffer is not None:
+            self._buffer.append(data)
+    
+    def end(self, tag: str) -> None:
+        if tag == "script" and self._buffer is not None:
+            # An empty script has no text, matching bs4's .string of None
+            self.scripts.append("".join(self._buffer) if self._buffer else None)
+            self._buffer = None
+    
+    def close(self) -> List[Optional[str]]:
+        return self.scripts
+
+
+def _collect_json_ld_scripts(html: str) -> List[Optional[str]]:
+    """Bodies of the page's JSON-LD scripts, in document order."""
+    parser = etree.HTMLParser(target=_JsonLdCollector())
+    parser.feed(html)
+    return parser.close()
 
 
 class JsonLdStrategy(ScraperStrategy):
     """Extracts dealer data from JSON-LD structured data."""
     
+    def __init__(self):
+        # Script bodies collected for can_handle, read again by extract_dealers
+        self._json_ld_scripts = LastParseCache(_collect_json_ld_scripts)
+    
     @property
     def strategy_name(self) -> str:
         return "JSON-LD Structured Data"
     
     def can_handle(self, html: str, page_url: str) -> bool:
         """Check if page contains JSON-LD structured data."""
-        soup = BeautifulSoup(html, "lxml")
-        json_ld_scripts = soup.find_all("script", {"type": "application/ld+json"})
-        return len(json_ld_scripts) > 0
+        return len(self._json_ld_scripts(html)) > 0
     
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from JSON-LD structured data."""
-        soup = BeautifulSoup(html, "lxml")
         dealers = []
         
         # Find all JSON-LD script tags
-        for script in soup.find_all("script", {"type": "application/ld+json"}):
+        for script_text in self._json_ld_scripts(html):
             try:
-                data = json.loads(script.string or "")
+                data = loads_json(script_text or "")
             except json.JSONDecodeError:
                 print(f"DEBUG: Failed to parse JSON-LD script", file=sys.stderr)
                 continue
             
             # Handle different JSON-LD structures
-            items = self._extract_items_from_data(data)
-            
-            for item in items:
+            for item in self._iter_items_from_data(data):
                 dealer = self._extract_dealer_from_item(item, page_url)
                 if dealer:
                     dealers.append(dealer)
@@ -50,52 +102,37 @@ class JsonLdStrategy(ScraperStrategy):
         print(f"DEBUG: JSON-LD strategy extracted {len(dealers)} dealers", file=sys.stderr)
         return dealers
     
-    def _extract_items_from_data(self, data: Any) -> List[Dict[str, Any]]:
-        """Extract items from JSON-LD data structure."""
-        items = []
-        
-        # Recursively collect any nested objects that match relevant @type
-        relevant_types = {"AutoDealer", "AutomotiveBusiness", "LocalBusiness"}
+    def _iter_items_from_data(self, data: Any) -> Iterator[Dict[str, Any]]:
+        """Yield items from JSON-LD data structure as the walk reaches them."""
+        # Depth-first walk over nested objects and lists, yielding the ones
+        # whose @type is relevant; scalars are never pushed onto the stack
+        if isinstance(data, dict):
+            stack: List[Any] = [data]
+        elif isinstance(data, list):
+            stack = [v for v in reversed(data) if isinstance(v, (dict, list))]
+        else:
+            return
 
-        def collect(obj, out: List[Dict[str, Any]]):
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
                 obj_type = obj.get("@type")
                 if isinstance(obj_type, list):
-                    if any(t in relevant_types for t in obj_type):
-                        out.append(obj)
-                elif isinstance(obj_type, str) and obj_type in relevant_types:
-                    out.append(obj)
-
-                # Traverse nested properties that often contain lists of entities
-                for v in obj.values():
-                    collect(v, out)
-            elif isinstance(obj, list):
-                for it in obj:
-                    collect(it, out)
-
-        roots: List[Any] = []
-        if isinstance(data, dict):
-            roots = [data]
-        elif isinstance(data, list):
-            roots = data
-
-        results: List[Dict[str, Any]] = []
-        for root in roots:
-            collect(root, results)
-
-        return results
+                    if any(t in _RELEVANT_TYPES for t in obj_type):
+                        yield obj
+                elif isinstance(obj_type, str) and obj_type in _RELEVANT_TYPES:
+                    yield obj
+                children = reversed(obj.values())
+            else:
+                children = reversed(obj)
+            # Reversed so the stack pops children in document order
+            stack.extend(v for v in children if isinstance(v, (dict, list)))
     
     def _is_corporate_entry(self, item: Dict[str, Any], name: str) -> bool:
         """Check if this JSON-LD item represents a corporate entity rather than a dealer location."""
         
         # Filter by name patterns
-        corporate_names = [
-            "auto group", "automotive group", "group", "motors", "corporation", "corp",
-            "sales", "service", "parts", "department", "headquarters", "hq"
-        ]
-        
-        name_lower = name.lower()
-        if any(corp_term in name_lower for corp_term in corporate_names):
+        if _CORPORATE_NAME_RE.search(name.lower()):
             return True
         
         # Filter by JSON-LD @type
@@ -103,13 +140,7 @@ class JsonLdStrategy(ScraperStrategy):
         if isinstance(json_type, list):
             json_type = json_type[0] if json_type else ""
         
-        # Corporate types that should be filtered out
-        corporate_types = [
-            "AutomotiveBusiness", "AutoDealer", "AutoRepair", "AutoBodyShop", 
-            "Organization", "Corporation", "LocalBusiness"
-        ]
-        
-        if any(corp_type in json_type for corp_type in corporate_types):
+        if _CORPORATE_TYPE_RE.search(json_type):
             # Additional check: if it has "department" field, it's likely corporate
             if "department" in item:
                 return True
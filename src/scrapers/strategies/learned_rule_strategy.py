@@ -1,15 +1,44 @@
 from typing import List, Dict, Any
 import re
+from functools import lru_cache, partial
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
 from ..base_scraper import ScraperStrategy
 from ...services.rule_store import RuleStore
+from ...utils.layout_signature import generate_layout_signature
+from ...utils.parse_cache import LastParseCache
+
+
+_CITY_STATE_ZIP_RE = re.compile(r"([^,]+),\s*([A-Za-z]{2})\s*(\d{5})")
+_PHONE_RE = re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+
+
+@lru_cache(maxsize=512)
+def _compile_path_pattern(path_pattern: str) -> "re.Pattern[str]":
+    """Compiled rule path pattern, shared across rule store reloads."""
+    return re.compile(path_pattern)
+
+
+@lru_cache(maxsize=1024)
+def _compile_selector(css: str) -> sv.SoupSieve:
+    """Compiled rule CSS selector, shared across pages and rule store reloads."""
+    return sv.compile(css)
+
+
+def _select_one(tag, css: str | None):
+    """First match of css under tag, or None when the rule has no selector."""
+    return _compile_selector(css).select_one(tag) if css else None
 
 
 class LearnedRuleExtractorStrategy(ScraperStrategy):
     def __init__(self, store: RuleStore | None = None) -> None:
         self.store = store or RuleStore()
+        # Parse and layout signature of the latest page; can_handle and
+        # extract_dealers both need them
+        self._parse = LastParseCache(partial(BeautifulSoup, features="lxml"))
+        self._generate_layout_signature = LastParseCache(self._compute_layout_signature)
 
     @property
     def strategy_name(self) -> str:
@@ -22,7 +51,7 @@ class LearnedRuleExtractorStrategy(ScraperStrategy):
         
         # Check domain-specific rules first
         rules = self.store.list_for_host(host)
-        if any(re.search(r.path_pattern, path) for r in rules):
+        if any(_compile_path_pattern(r.path_pattern).search(path) for r in rules):
             return True
             
         # Check pattern-based rules
@@ -48,38 +77,44 @@ class LearnedRuleExtractorStrategy(ScraperStrategy):
             layout_signature = self._generate_layout_signature(html)
             if layout_signature:
                 rules = [r for r in pattern_rules if r.path_pattern == layout_signature]
-        
-        soup = BeautifulSoup(html, "lxml")
+
+        # For pattern rules, we already matched, skip path check
+        rules = [
+            r for r in rules
+            if r.host == "*pattern*" or _compile_path_pattern(r.path_pattern).search(path)
+        ]
+
+        # Nothing to select with, so skip parsing the page
+        if not rules:
+            return []
+
+        soup = self._parse(html)
         dealers: List[Dict[str, Any]] = []
 
         for r in rules:
-            # For pattern rules, we already matched, skip path check
-            if r.host != "*pattern*" and not re.search(r.path_pattern, path):
-                continue
-            cards = soup.select(r.card_selector)
+            cards = _compile_selector(r.card_selector).select(soup)
             for card in cards:
-                name_el = card.select_one(r.fields.get("name", "")) if r.fields.get("name") else None
+                name_el = _select_one(card, r.fields.get("name"))
                 name = name_el.get_text(strip=True) if name_el else ""
-                street_el = card.select_one(r.fields.get("street", "")) if r.fields.get("street") else None
+                street_el = _select_one(card, r.fields.get("street"))
                 street = street_el.get_text(strip=True) if street_el else ""
-                csz_el = card.select_one(r.fields.get("city_state_zip", "")) if r.fields.get("city_state_zip") else None
+                csz_el = _select_one(card, r.fields.get("city_state_zip"))
                 csz = csz_el.get_text(strip=True) if csz_el else ""
                 city = state = zip_code = ""
                 if csz:
-                    m = re.search(r"([^,]+),\s*([A-Za-z]{2})\s*(\d{5})", csz)
+                    m = _CITY_STATE_ZIP_RE.search(csz)
                     if m:
                         city, state, zip_code = m.groups()
                 phone = ""
-                ph_el = card.select_one(r.fields.get("phone", "")) if r.fields.get("phone") else None
+                ph_el = _select_one(card, r.fields.get("phone"))
                 if ph_el:
                     t = ph_el.get_text(" ", strip=True)
-                    pm = re.search(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", t)
+                    pm = _PHONE_RE.search(t)
                     if pm:
                         phone = pm.group(0)
 
                 site = page_url
-                website_selector = r.fields.get("website", "a[href]")
-                a = card.select_one(website_selector) if website_selector else card.select_one("a[href]")
+                a = _select_one(card, r.fields.get("website", "a[href]") or "a[href]")
                 if a and a.has_attr("href") and a["href"].startswith("http"):
                     site = a["href"]
 
@@ -99,57 +134,10 @@ class LearnedRuleExtractorStrategy(ScraperStrategy):
 
         return dealers
 
-    def _generate_layout_signature(self, html: str) -> str:
+    def _compute_layout_signature(self, html: str) -> str:
         """Generate a layout signature based on HTML structure patterns."""
         try:
-            soup = BeautifulSoup(html, "lxml")
-            
-            # Analyze structure patterns
-            signatures = []
-            
-            # Count common container patterns
-            sections = len(soup.find_all(['section', 'div', 'article'], class_=lambda x: x and any(
-                keyword in x.lower() for keyword in ['location', 'dealer', 'store', 'office', 'branch']
-            )))
-            if sections >= 3:
-                signatures.append(f"containers:{sections}")
-            
-            # Check for list patterns
-            lists = soup.find_all(['ul', 'ol'])
-            list_items = sum(len(lst.find_all('li')) for lst in lists)
-            if list_items >= 3:
-                signatures.append(f"lists:{list_items}")
-            
-            # Check for address-like patterns
-            address_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Dr|Drive)',
-                text
-            ))
-            if len(address_patterns) >= 3:
-                signatures.append("addresses:multiple")
-            
-            # Check for phone patterns
-            phone_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-                text
-            ))
-            if len(phone_patterns) >= 3:
-                signatures.append("phones:multiple")
-            
-            # Check for state patterns (common in dealer listings)
-            state_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\b[A-Z]{2}\s+\d{5}',  # State code + ZIP
-                text
-            ))
-            if len(state_patterns) >= 3:
-                signatures.append("states:multiple")
-            
-            # Generate final signature
-            if len(signatures) >= 2:  # Need at least 2 pattern indicators
-                return "layout:" + "|".join(sorted(signatures))
-            
-            return ""
-            
+            soup = self._parse(html)
         except Exception:
             return ""
-
+        return generate_layout_signature(soup)
@@ -6,60 +6,109 @@ Lithia Motors dealer location pages.
 """
 
 from typing import List, Dict, Any
-import sys
-from bs4 import BeautifulSoup
+import logging
+from functools import partial
+from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
 
 from ..base_scraper import ScraperStrategy
+from ...utils.parse_cache import LastParseCache
+
+
+_INFO_WINDOW_SELECTOR = sv.compile("li.info-window")
+
+# hCard classes read from each info-window
+_FIELD_CLASSES = ("org", "street-address", "locality", "region", "postal-code")
 
 
 class LithiaStrategy(ScraperStrategy):
     """Extracts dealer data from Lithia Motors specific HTML structure."""
     
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # The info-window probe's parse, kept for extract_dealers
+        self._parse = LastParseCache(partial(BeautifulSoup, features="lxml"))
+    
     @property
     def strategy_name(self) -> str:
         return "Lithia Motors HTML"
     
     def can_handle(self, html: str, page_url: str) -> bool:
         """Check if page contains Lithia-specific HTML structure."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Look for Lithia-specific CSS classes
-        lithia_indicators = soup.select("li.info-window")
-        
         # Also check for Lithia in the page content or URL
         is_lithia_page = (
             "lithia" in page_url.lower() or
             "lithia" in html.lower()
         )
         
-        return len(lithia_indicators) > 0 and is_lithia_page
+        # Look for Lithia-specific CSS classes, parsing only when the class
+        # name appears somewhere in the page
+        if not is_lithia_page or "info-window" not in html:
+            return False
+        return _INFO_WINDOW_SELECTOR.select_one(self._parse(html)) is not None
     
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
         """Extract dealers from Lithia-specific HTML structure."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         dealers = []
         
         # Extract from li.info-window elements
-        for li in soup.select("li.info-window"):
+        for li in _INFO_WINDOW_SELECTOR.iselect(soup):
             dealer = self._extract_dealer_from_info_window(li, page_url)
             if dealer:
                 dealers.append(dealer)
         
-        print(f"DEBUG: Lithia strategy extracted {len(dealers)} dealers", file=sys.stderr)
+        self.logger.debug("DEBUG: Lithia strategy extracted %d dealers", len(dealers))
         return dealers
     
+    def _find_info_window_fields(self, li_element: Tag) -> Dict[str, Tag]:
+        """
+        First element of each field in an info-window, found in one walk.
+        
+        Keys are the hCard classes plus "url" (a.url), "tel" (the Sales
+        .tel) and "value" (a .value inside any Sales .tel).
+        """
+        fields: Dict[str, Tag] = {}
+        sales_phones = set()
+        for el in li_element.descendants:
+            if type(el) is not Tag:
+                continue
+            classes = el.get("class")
+            if not classes:
+                continue
+            for cls in _FIELD_CLASSES:
+                if cls in classes and cls not in fields:
+                    fields[cls] = el
+            if "url" in classes and el.name == "a" and "url" not in fields:
+                fields["url"] = el
+            if "tel" in classes and el.get("data-click-to-call") == "Sales":
+                sales_phones.add(id(el))
+                fields.setdefault("tel", el)
+            if "value" in classes and "value" not in fields and sales_phones:
+                # Ancestors are walked before their descendants, so any Sales
+                # .tel around this element has already been seen
+                parent = el.parent
+                while parent is not None and parent is not li_element:
+                    if id(parent) in sales_phones:
+                        fields["value"] = el
+                        break
+                    parent = parent.parent
+        return fields
+    
     def _extract_dealer_from_info_window(self, li_element, page_url: str) -> Dict[str, Any]:
         """Extract dealer information from a Lithia info-window element."""
         try:
+            fields = self._find_info_window_fields(li_element)
+            
             # Extract dealer name
-            name_el = li_element.select_one(".org")
+            name_el = fields.get("org")
             name = name_el.get_text(strip=True) if name_el else ""
             
             if not name:
                 return None
             
             # Extract website
-            website_el = li_element.select_one("a.url")
+            website_el = fields.get("url")
             website = ""
             if website_el and website_el.has_attr("href"):
                 website = website_el["href"]
@@ -67,10 +116,10 @@ class LithiaStrategy(ScraperStrategy):
                 website = page_url
             
             # Extract address components
-            street_el = li_element.select_one(".street-address")
-            city_el = li_element.select_one(".locality")
-            state_el = li_element.select_one(".region")
-            zip_el = li_element.select_one(".postal-code")
+            street_el = fields.get("street-address")
+            city_el = fields.get("locality")
+            state_el = fields.get("region")
+            zip_el = fields.get("postal-code")
             
             street = street_el.get_text(strip=True) if street_el else ""
             city = city_el.get_text(strip=True) if city_el else ""
@@ -79,12 +128,12 @@ class LithiaStrategy(ScraperStrategy):
             
             # Extract phone number
             phone = ""
-            phone_el = li_element.select_one(".tel[data-click-to-call='Sales']")
+            phone_el = fields.get("tel")
             
             if phone_el and phone_el.has_attr("data-click-to-call-phone"):
                 phone = phone_el["data-click-to-call-phone"]
             else:
-                phone_val = li_element.select_one(".tel[data-click-to-call='Sales'] .value")
+                phone_val = fields.get("value")
                 if phone_val:
                     phone = phone_val.get_text(strip=True)
             
@@ -99,5 +148,5 @@ class LithiaStrategy(ScraperStrategy):
             }
             
         except Exception as e:
-            print(f"DEBUG: Error extracting dealer from Lithia info-window: {e}", file=sys.stderr)
+            self.logger.debug("DEBUG: Error extracting dealer from Lithia info-window: %s", e)
             return None
\ No newline at end of file
@@ -1,11 +1,15 @@
 from typing import List, Dict, Any
+import importlib.util
 import os
 import re
+from functools import lru_cache
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
 from ..base_scraper import ScraperStrategy
 from ...services.rule_store import RuleStore, DomainRule
+from ...utils.json_loader import loads_json
+from ...utils.layout_signature import generate_layout_signature
 
 
 PROMPT = (
@@ -15,6 +19,52 @@ PROMPT = (
     "Return JSON only, no extra text."
 )
 
+# Script, style and noscript elements, dropped before the page is sent
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style|noscript)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+
+# Characters of compacted HTML sent to the model
+_MAX_PROMPT_CHARS = 40000
+
+# Fallback for responses that wrap the JSON array in other text
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+# Field validation
+_STATE_CODE_RE = re.compile(r"^[A-Z]{2}$")
+_ZIP_CODE_RE = re.compile(r"^\d{5}(-\d{4})?$")
+_PHONE_DIGITS_RE = re.compile(r"\d{3}[-.\s]?\d{3}[-.\s]?\d{4}")
+
+
+def _compact_html(html: str, limit: int = _MAX_PROMPT_CHARS) -> str:
+    """
+    First limit characters of html with script/style/noscript elements removed.
+    
+    Same result as _SCRIPT_STYLE_RE.sub("", html)[:limit], but stops scanning
+    once enough markup has been kept instead of rewriting the whole page.
+    """
+    parts = []
+    size = 0
+    pos = 0
+    for match in _SCRIPT_STYLE_RE.finditer(html):
+        chunk = html[pos:match.start()]
+        parts.append(chunk)
+        size += len(chunk)
+        pos = match.end()
+        if size >= limit:
+            return "".join(parts)[:limit]
+    parts.append(html[pos:pos + limit - size])
+    return "".join(parts)
+
+
+# Checked without importing; openai is only imported once a client is built
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """OpenAI client for api_key, shared so calls reuse its connection pool."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
 
 class LLMExtractorStrategy(ScraperStrategy):
     def __init__(self, store: RuleStore | None = None) -> None:
@@ -33,16 +83,11 @@ class LLMExtractorStrategy(ScraperStrategy):
         return self._extract_with_llm(html, page_url)
 
     def _extract_with_llm(self, html: str, page_url: str) -> List[Dict[str, Any]]:
-        try:
-            from openai import OpenAI
-        except Exception:
+        if not OPENAI_AVAILABLE:
             return []
 
         # Compact HTML: strip scripts/styles; keep text+links
-        soup = BeautifulSoup(html, "lxml")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-        text_html = str(soup)[:40000]
+        text_html = _compact_html(html)
 
         # Get API key from environment
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -58,7 +103,7 @@ class LLMExtractorStrategy(ScraperStrategy):
         
         print(f"DEBUG: Using OpenAI API key: {api_key[:20]}...")
 
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         
         try:
             completion = client.chat.completions.create(
@@ -79,9 +124,8 @@ class LLMExtractorStrategy(ScraperStrategy):
 
         content = completion.choices[0].message.content
         # Try to find JSON array in the response
-        import json
         try:
-            data = json.loads(content)
+            data = loads_json(content)
             if isinstance(data, dict) and "items" in data:
                 items = data["items"]
             elif isinstance(data, list):
@@ -90,9 +134,8 @@ class LLMExtractorStrategy(ScraperStrategy):
                 items = []
         except Exception:
             # Fallback: extract first JSON array
-            m = re.search(r"\[(?:.|\n)*\]", content)
-            import json
-            items = json.loads(m.group(0)) if m else []
+            m = _JSON_ARRAY_RE.search(content)
+            items = loads_json(m.group(0)) if m else []
 
         # Validate and normalize; also attempt to promote a basic learned rule
         parsed = urlparse(page_url)
@@ -110,11 +153,11 @@ class LLMExtractorStrategy(ScraperStrategy):
 
             if not name or not (street or (city and state)):
                 continue
-            if state and not re.match(r"^[A-Z]{2}$", state):
+            if state and not _STATE_CODE_RE.match(state):
                 continue
-            if zip_code and not re.match(r"^\d{5}(-\d{4})?$", zip_code):
+            if zip_code and not _ZIP_CODE_RE.match(zip_code):
                 zip_code = ""
-            if phone and not re.search(r"\d{3}[-.\s]?\d{3}[-.\s]?\d{4}", phone):
+            if phone and not _PHONE_DIGITS_RE.search(phone):
                 phone = ""
 
             dealers.append({
@@ -182,53 +225,6 @@ class LLMExtractorStrategy(ScraperStrategy):
         """Generate a layout signature based on HTML structure patterns."""
         try:
             soup = BeautifulSoup(html, "lxml")
-            
-            # Analyze structure patterns
-            signatures = []
-            
-            # Count common container patterns
-            sections = len(soup.find_all(['section', 'div', 'article'], class_=lambda x: x and any(
-                keyword in x.lower() for keyword in ['location', 'dealer', 'store', 'office', 'branch']
-            )))
-            if sections >= 3:
-                signatures.append(f"containers:{sections}")
-            
-            # Check for list patterns
-            lists = soup.find_all(['ul', 'ol'])
-            list_items = sum(len(lst.find_all('li')) for lst in lists)
-            if list_items >= 3:
-                signatures.append(f"lists:{list_items}")
-            
-            # Check for address-like patterns
-            address_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Dr|Drive)',
-                text
-            ))
-            if len(address_patterns) >= 3:
-                signatures.append("addresses:multiple")
-            
-            # Check for phone patterns
-            phone_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-                text
-            ))
-            if len(phone_patterns) >= 3:
-                signatures.append("phones:multiple")
-            
-            # Check for state patterns (common in dealer listings)
-            state_patterns = soup.find_all(text=lambda text: text and re.search(
-                r'\b[A-Z]{2}\s+\d{5}',  # State code + ZIP
-                text
-            ))
-            if len(state_patterns) >= 3:
-                signatures.append("states:multiple")
-            
-            # Generate final signature
-            if len(signatures) >= 2:  # Need at least 2 pattern indicators
-                return "layout:" + "|".join(sorted(signatures))
-            
-            return ""
-            
         except Exception:
             return ""
-
+        return generate_layout_signature(soup)
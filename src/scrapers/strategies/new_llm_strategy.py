@@ -3,22 +3,59 @@ NEW LLM fallback strategy with hardcoded API key to bypass caching issues.
 """
 
 import json
+import logging
 import os
 import re
-import sys
+from functools import lru_cache
+from html import unescape
 from typing import List, Dict, Any
 
-from bs4 import BeautifulSoup
 from openai import OpenAI
 
 from ..base_scraper import ScraperStrategy
 from ...utils.address_parser import parse_address
 from ...utils.data_cleaner import data_cleaner
+from ...utils.json_loader import loads_json
+
+
+# Elements and comments whose content never reaches the prompt; <meta> and
+# <link> are void, so they go with the remaining tags below
+_NON_CONTENT_RE = re.compile(
+    r"<(script|style|noscript|head)\b[^>]*>.*?</\1\s*>|<!--.*?-->", re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+# Expanded keywords for better content detection, matched as substrings of
+# each lowercased line
+_DEALER_KEYWORDS = (
+    'location', 'dealer', 'address', 'phone', 'store', 'showroom', 'service', 'sales',
+    'automotive', 'contact', 'hours', 'directions', 'visit', 'find us', 'our locations',
+    'ray skillman', 'indianapolis', 'indiana', 'zip', 'call', 'email', 'street', 'avenue'
+)
+_DEALER_KEYWORD_RE = re.compile("|".join(map(re.escape, _DEALER_KEYWORDS)))
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> OpenAI:
+    """OpenAI client for api_key, shared so calls reuse its connection pool."""
+    return OpenAI(api_key=api_key)
+
+
+def _safe_str(value) -> str:
+    """Safely extract a string value from an LLM field (str, list or scalar)."""
+    if type(value) is str:
+        return value.strip()
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value).strip()
+    return str(value).strip() if value else ""
 
 
 class NewLLMExtractorStrategy(ScraperStrategy):
     """Uses OpenAI to extract dealer data from HTML as a fallback strategy."""
     
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+    
     @property
     def strategy_name(self) -> str:
         return "NEW LLM Fallback Extractor"
@@ -37,41 +74,35 @@ class NewLLMExtractorStrategy(ScraperStrategy):
         # Use hardcoded API key to bypass all environment issues
         api_key = os.environ.get("OPENAI_API_KEY")
         
-        print(f"NEW LLM DEBUG: Using hardcoded API key: {api_key[:20]}...")
-        
-        # Clean HTML for LLM processing - MUCH smaller for rate limits
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup(["script", "style", "noscript", "head", "meta", "link"]):
-            tag.decompose()
+        self.logger.debug("NEW LLM DEBUG: Using hardcoded API key: %s...", api_key[:20])
         
-        # Keep only text content, much smaller
-        text_content = soup.get_text()
+        # Clean HTML for LLM processing - MUCH smaller for rate limits.
+        # Stripped with regexes rather than a parse; only the text is kept
+        text_content = unescape(_TAG_RE.sub("", _NON_CONTENT_RE.sub("", html)))
         
         # Smart content extraction - look for dealer-related content
         lines = text_content.split('\n')
         dealer_related_lines = []
         
-        # Expanded keywords for better content detection
-        dealer_keywords = ['location', 'dealer', 'address', 'phone', 'store', 'showroom', 'service', 'sales', 
-                          'automotive', 'contact', 'hours', 'directions', 'visit', 'find us', 'our locations',
-                          'ray skillman', 'indianapolis', 'indiana', 'zip', 'call', 'email', 'street', 'avenue']
-        
         for line in lines:
             line = line.strip()
-            if line and any(keyword.lower() in line.lower() for keyword in dealer_keywords):
+            if line and _DEALER_KEYWORD_RE.search(line.lower()):
                 dealer_related_lines.append(line)
         
         # If we found dealer-related content, use more of it; otherwise try middle section
         if dealer_related_lines and len('\n'.join(dealer_related_lines)) > 500:
             text_html = '\n'.join(dealer_related_lines)[:8000]  # Much larger for Ray Skillman
-            print(f"NEW LLM DEBUG: Using {len(text_html)} RELEVANT characters (found {len(dealer_related_lines)} relevant lines)")
+            self.logger.debug(
+                "NEW LLM DEBUG: Using %d RELEVANT characters (found %d relevant lines)",
+                len(text_html), len(dealer_related_lines)
+            )
         else:
             # Try middle section instead of beginning (avoid headers/nav)
             middle_start = len(text_content) // 3
             text_html = text_content[middle_start:middle_start + 8000]
-            print(f"NEW LLM DEBUG: Using {len(text_html)} MIDDLE characters (no relevant content found)")
+            self.logger.debug("NEW LLM DEBUG: Using %d MIDDLE characters (no relevant content found)", len(text_html))
         
-        print(f"NEW LLM DEBUG: Using {len(text_html)} characters (reduced from {len(html)})")
+        self.logger.debug("NEW LLM DEBUG: Using %d characters (reduced from %d)", len(text_html), len(html))
         
         PROMPT = """
 You are an expert at extracting dealership location data from HTML content.
@@ -91,7 +122,7 @@ Return your response as a JSON array of objects, where each object represents a
 If you find dealerships, return them in this exact JSON format. If no dealerships are found, return an empty array [].
 """
         
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         
         try:
             completion = client.chat.completions.create(
@@ -105,11 +136,12 @@ If you find dealerships, return them in this exact JSON format. If no dealership
             )
             
             response_text = completion.choices[0].message.content
-            print(f"NEW LLM DEBUG: Got response: {response_text[:200]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("NEW LLM DEBUG: Got response: %s...", response_text[:200])
             
             # Parse JSON response
             try:
-                response_data = json.loads(response_text)
+                response_data = loads_json(response_text)
                 if isinstance(response_data, dict) and "dealerships" in response_data:
                     dealers = response_data["dealerships"]
                 elif isinstance(response_data, list):
@@ -117,30 +149,25 @@ If you find dealerships, return them in this exact JSON format. If no dealership
                 elif isinstance(response_data, dict) and "dealers" in response_data:
                     dealers = response_data["dealers"]
                 else:
-                    print(f"NEW LLM DEBUG: Unexpected response format: {response_data}")
+                    self.logger.debug("NEW LLM DEBUG: Unexpected response format: %s", response_data)
                     return []
                 
-                print(f"NEW LLM DEBUG: Extracted {len(dealers)} dealers via LLM")
+                self.logger.debug("NEW LLM DEBUG: Extracted %d dealers via LLM", len(dealers))
                 
                 # Process each dealer
                 processed_dealers = []
                 for dealer in dealers:
-                    if isinstance(dealer, dict) and dealer.get("name"):
-                        # Helper function to safely extract string values
-                        def safe_str(value):
-                            if isinstance(value, list):
-                                return ", ".join(str(v) for v in value).strip()
-                            return str(value).strip() if value else ""
-                        
+                    name = dealer.get("name") if isinstance(dealer, dict) else None
+                    if name:
                         processed_dealer = {
-                            "name": safe_str(dealer.get("name", "")),
-                            "street": safe_str(dealer.get("street", "")),
-                            "city": safe_str(dealer.get("city", "")),
-                            "state": safe_str(dealer.get("state", "")),
-                            "zip": safe_str(dealer.get("zip", "")),
-                            "phone": safe_str(dealer.get("phone", "")),
-                            "website": safe_str(dealer.get("website", "")),
-                            "car_brands": safe_str(dealer.get("brands", ""))
+                            "name": _safe_str(name),
+                            "street": _safe_str(dealer.get("street", "")),
+                            "city": _safe_str(dealer.get("city", "")),
+                            "state": _safe_str(dealer.get("state", "")),
+                            "zip": _safe_str(dealer.get("zip", "")),
+                            "phone": _safe_str(dealer.get("phone", "")),
+                            "website": _safe_str(dealer.get("website", "")),
+                            "car_brands": _safe_str(dealer.get("brands", ""))
                         }
                         
                         # Only include dealers with at least name and some location info
@@ -150,10 +177,10 @@ If you find dealerships, return them in this exact JSON format. If no dealership
                 return processed_dealers
                 
             except json.JSONDecodeError as e:
-                print(f"NEW LLM ERROR: Failed to parse JSON response: {e}")
-                print(f"NEW LLM ERROR: Response was: {response_text}")
+                self.logger.error("NEW LLM ERROR: Failed to parse JSON response: %s", e)
+                self.logger.error("NEW LLM ERROR: Response was: %s", response_text)
                 return []
                 
         except Exception as e:
-            print(f"NEW LLM ERROR: API call failed: {str(e)}")
+            self.logger.error("NEW LLM ERROR: API call failed: %s", e)
             return []
@@ -1,10 +1,14 @@
 from typing import List, Dict, Any, Optional
 from urllib.parse import unquote
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from ..base_scraper import ScraperStrategy
 
 
+# Microformat classes read from each Google Maps anchor
+_FIELD_CLASSES = ("street-address", "locality", "region", "postal-code")
+
+
 class OverfuelLocationsStrategy(ScraperStrategy):
     """Parses Overfuel-powered locations pages (e.g., ALM Cars location finder)."""
 
@@ -13,32 +17,50 @@ class OverfuelLocationsStrategy(ScraperStrategy):
         return "Overfuel Locations HTML"
 
     def can_handle(self, html: str, page_url: str) -> bool:
-        soup = BeautifulSoup(html, "html.parser")
+        # The brand alone is enough, so only parse when it is missing
+        if "overfuel" in html.lower():
+            return True
 
-        has_overfuel_brand = "overfuel" in html.lower()
+        # The header and microformat checks need these strings in the raw page
+        if not ("Find a Location" in html and "street-address" in html and "google.com/maps/search" in html):
+            return False
+
+        soup = BeautifulSoup(html, "lxml")
         has_locations_header = bool(soup.find(text=lambda t: t and "Find a Location" in t))
         has_microformat_spans = bool(soup.select("a[href*='google.com/maps/search'] .street-address"))
 
-        return has_overfuel_brand or (has_locations_header and has_microformat_spans)
+        return has_locations_header and has_microformat_spans
 
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         dealers: List[Dict[str, Any]] = []
         seen: set[tuple[str, str, str]] = set()
+        # Fields of every anchor and the first anchor of every card, recorded in
+        # pass A so pass B does not query the same subtrees again
+        anchor_fields: Dict[int, Dict[str, Tag]] = {}
+        card_anchors: Dict[int, tuple[Tag, Tag]] = {}
+        first_tels = self._index_first_tel_links(soup)
 
         # Pass A: collect from ALL Google Maps anchors (footer contains full list)
         for anchor in soup.select("a[href*='google.com/maps/search']"):
-            name_el = anchor.select_one("b, .org")
-            street_el = anchor.select_one(".street-address")
-            city_el = anchor.select_one(".locality")
-            state_el = anchor.select_one(".region")
-            zip_el = anchor.select_one(".postal-code")
+            fields = anchor_fields[id(anchor)] = self._find_anchor_fields(anchor)
+            new_cards = [
+                parent for parent in anchor.parents
+                if parent.name == "div" and "card" in (parent.get("class") or ())
+                and id(parent) not in card_anchors
+            ]
+            # Anchors come in document order and cards are added outermost
+            # first, so card_anchors keeps the cards' document order
+            for card in reversed(new_cards):
+                card_anchors[id(card)] = (card, anchor)
+
+            name_el = fields.get("name")
+            street_el = fields.get("street-address")
+            city_el = fields.get("locality")
 
             name = (name_el.get_text(strip=True) if name_el else "").strip()
             street = (street_el.get_text(strip=True) if street_el else "").strip()
             city = (city_el.get_text(strip=True) if city_el else "").strip()
-            state = (state_el.get_text(strip=True) if state_el else "").strip()
-            zip_code = (zip_el.get_text(strip=True) if zip_el else "").strip()
 
             if not name:
                 href = anchor.get("href", "")
@@ -49,6 +71,17 @@ class OverfuelLocationsStrategy(ScraperStrategy):
                 except Exception:
                     name = ""
 
+            # A duplicate is dropped whatever its other fields hold, so check
+            # the key before reading them
+            key = (name.lower(), street.lower(), city.lower())
+            if key in seen:
+                continue
+
+            state_el = fields.get("region")
+            zip_el = fields.get("postal-code")
+            state = (state_el.get_text(strip=True) if state_el else "").strip()
+            zip_code = (zip_el.get_text(strip=True) if zip_el else "").strip()
+
             if not (name and street and city and state):
                 continue
 
@@ -57,13 +90,10 @@ class OverfuelLocationsStrategy(ScraperStrategy):
             parent = anchor
             for _ in range(3):
                 parent = parent.parent if parent and parent.parent else parent
-            tel_link = parent.select_one("a[href^='tel:']") if hasattr(parent, "select_one") else None
+            tel_link = first_tels.get(id(parent))
             if tel_link:
                 phone = tel_link.get("href", "").replace("tel:", "").strip()
 
-            key = (name.lower(), street.lower(), city.lower())
-            if key in seen:
-                continue
             seen.add(key)
 
             dealers.append({
@@ -77,15 +107,12 @@ class OverfuelLocationsStrategy(ScraperStrategy):
             })
 
         # Pass B: card-based enrichment/additions (if any cards weren’t covered)
-        for card in soup.select("div.card"):
+        for card, anchor in card_anchors.values():
             header_name_el = card.select_one(".card-header h6")
-            anchor = card.select_one("a[href*='google.com/maps/search']")
-            if not anchor:
-                continue
-
+            fields = anchor_fields[id(anchor)]
             name = (header_name_el.get_text(strip=True) if header_name_el else "").strip()
             if not name:
-                name_el = anchor.select_one("b, .org")
+                name_el = fields.get("name")
                 if name_el:
                     name = name_el.get_text(strip=True)
             if not name:
@@ -97,24 +124,26 @@ class OverfuelLocationsStrategy(ScraperStrategy):
                 except Exception:
                     name = ""
 
-            street_el = anchor.select_one(".street-address")
-            city_el = anchor.select_one(".locality")
-            state_el = anchor.select_one(".region")
-            zip_el = anchor.select_one(".postal-code")
+            street_el = fields.get("street-address")
+            city_el = fields.get("locality")
             street = (street_el.get_text(strip=True) if street_el else "").strip()
             city = (city_el.get_text(strip=True) if city_el else "").strip()
+
+            key = (name.lower(), street.lower(), city.lower())
+            if key in seen:
+                continue
+
+            state_el = fields.get("region")
+            zip_el = fields.get("postal-code")
             state = (state_el.get_text(strip=True) if state_el else "").strip()
             zip_code = (zip_el.get_text(strip=True) if zip_el else "").strip()
 
             if not (name and street and city and state):
                 continue
 
-            tel_link = card.select_one("a[href^='tel:']")
+            tel_link = first_tels.get(id(card))
             phone = tel_link.get("href", "").replace("tel:", "").strip() if tel_link else ""
 
-            key = (name.lower(), street.lower(), city.lower())
-            if key in seen:
-                continue
             seen.add(key)
 
             dealers.append({
@@ -129,3 +158,38 @@ class OverfuelLocationsStrategy(ScraperStrategy):
 
         return dealers
 
+    def _index_first_tel_links(self, soup: BeautifulSoup) -> Dict[int, Tag]:
+        """
+        Map id() of every element containing a tel link to its first one.
+
+        Equivalent to element.select_one("a[href^='tel:']") for any element,
+        without searching the element's subtree each time.
+        """
+        first_tels: Dict[int, Tag] = {}
+        for tel_link in soup.select("a[href^='tel:']"):
+            for parent in tel_link.parents:
+                # Links come in document order, so an ancestor that already
+                # has a link keeps it, and so do all of its own ancestors
+                if id(parent) in first_tels:
+                    break
+                first_tels[id(parent)] = tel_link
+        return first_tels
+
+    def _find_anchor_fields(self, anchor: Tag) -> Dict[str, Tag]:
+        """
+        First element of each field in a Google Maps anchor, found in one walk.
+
+        Keys are the microformat classes plus "name" (the first b or .org).
+        """
+        fields: Dict[str, Tag] = {}
+        for el in anchor.descendants:
+            if type(el) is not Tag:
+                continue
+            classes = el.get("class") or ()
+            if "name" not in fields and (el.name == "b" or "org" in classes):
+                fields["name"] = el
+            for cls in _FIELD_CLASSES:
+                if cls in classes and cls not in fields:
+                    fields[cls] = el
+        return fields
+
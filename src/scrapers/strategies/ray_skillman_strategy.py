@@ -6,6 +6,34 @@ import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup, Tag
 from ..base_scraper import BaseScraper
+from ...utils.json_loader import loads_json
+
+
+# Location containers are divs and sections whose class mentions one of these
+_CONTAINER_TAGS = frozenset(('div', 'section'))
+_LOCATION_CLASS_RE = re.compile(r'location|dealer|store', re.I)
+
+# Street addresses found anywhere in the page text
+_TEXT_ADDRESS_RE = re.compile(r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr|Lane|Ln|Way|Court|Ct))', re.I)
+
+# Fields of a single location container
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_ADDRESS_RE = re.compile(r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr))', re.I)
+_CITY_STATE_ZIP_RE = re.compile(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5})')
+
+
+def _find_location_containers(soup: BeautifulSoup) -> List[Tag]:
+    """Find location containers in one walk, testing each class attribute once."""
+    containers = []
+    for el in soup.descendants:
+        if type(el) is Tag and el.name in _CONTAINER_TAGS:
+            classes = el.attrs.get('class')
+            if classes:
+                if not isinstance(classes, str):
+                    classes = ' '.join(classes)
+                if _LOCATION_CLASS_RE.search(classes):
+                    containers.append(el)
+    return containers
 
 
 class RaySkillmanStrategy(BaseScraper):
@@ -19,13 +47,13 @@ class RaySkillmanStrategy(BaseScraper):
     
     def extract_dealers(self, html: str, url: str) -> List[Dict[str, Any]]:
         """Extract dealer information from Ray Skillman HTML."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         dealers = []
         
         print(f"DEBUG: Ray Skillman strategy processing {len(html)} characters")
         
         # Strategy 1: Look for location cards/containers
-        location_containers = soup.find_all(['div', 'section'], class_=re.compile(r'location|dealer|store', re.I))
+        location_containers = _find_location_containers(soup)
         print(f"DEBUG: Found {len(location_containers)} location containers")
         
         for container in location_containers:
@@ -35,9 +63,8 @@ class RaySkillmanStrategy(BaseScraper):
         
         # Strategy 2: Look for address patterns in text
         if not dealers:
-            address_pattern = re.compile(r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr|Lane|Ln|Way|Court|Ct))', re.I)
             text_content = soup.get_text()
-            addresses = address_pattern.findall(text_content)
+            addresses = _TEXT_ADDRESS_RE.findall(text_content)
             print(f"DEBUG: Found {len(addresses)} potential addresses in text")
             
             for address in addresses[:10]:  # Limit to reasonable number
@@ -53,11 +80,9 @@ class RaySkillmanStrategy(BaseScraper):
                 dealers.append(dealer)
         
         # Strategy 3: Look for structured data
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
+        for script in soup.find_all('script', type='application/ld+json'):
             try:
-                import json
-                data = json.loads(script.string or '{}')
+                data = loads_json(script.string or '{}')
                 if isinstance(data, dict) and data.get('@type') in ['AutoDealer', 'LocalBusiness']:
                     address = data.get('address', {})
                     dealer = {
@@ -87,18 +112,15 @@ class RaySkillmanStrategy(BaseScraper):
             text = container.get_text()
             
             # Look for phone pattern
-            phone_pattern = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-            phone_match = phone_pattern.search(text)
+            phone_match = _PHONE_RE.search(text)
             phone = phone_match.group() if phone_match else ""
             
             # Look for address pattern
-            address_pattern = re.compile(r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr))', re.I)
-            address_match = address_pattern.search(text)
+            address_match = _ADDRESS_RE.search(text)
             street = address_match.group() if address_match else ""
             
             # Look for city, state zip pattern
-            city_state_zip_pattern = re.compile(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5})')
-            csz_match = city_state_zip_pattern.search(text)
+            csz_match = _CITY_STATE_ZIP_RE.search(text)
             
             if csz_match:
                 city, state, zip_code = csz_match.groups()
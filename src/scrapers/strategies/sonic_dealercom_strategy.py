@@ -1,10 +1,14 @@
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 
 from ..base_scraper import ScraperStrategy
 
 
+# extract_dealers only reads inside the dealer list, so only that subtree is built
+_DEALER_LIST_STRAINER = SoupStrainer("ol", id="proximity-dealer-list")
+
+
 class DealerDotComLocationsStrategy(ScraperStrategy):
     """Parses Dealer.com locations pages (e.g., Sonic Automotive Locations)."""
 
@@ -13,6 +17,10 @@ class DealerDotComLocationsStrategy(ScraperStrategy):
         return "Dealer.com Locations HTML"
 
     def can_handle(self, html: str, page_url: str) -> bool:
+        # Both checks below need the dealer list, so skip the parse without its id
+        if "proximity-dealer-list" not in html:
+            return False
+
         soup = BeautifulSoup(html, "lxml")
 
         # Typical structure: <div class="dealer-list"> with <ol id="proximity-dealer-list">
@@ -27,7 +35,7 @@ class DealerDotComLocationsStrategy(ScraperStrategy):
         return has_dealer_list and (is_sonic or len(vcard_samples) >= 5)
 
     def extract_dealers(self, html: str, page_url: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_DEALER_LIST_STRAINER)
         dealers: List[Dict[str, Any]] = []
 
         for li in soup.select("ol#proximity-dealer-list li.info-window"):
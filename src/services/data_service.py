@@ -6,6 +6,7 @@ validation, cleaning, transformation, and export formatting.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import pandas as pd
 from io import BytesIO
@@ -14,6 +15,25 @@ from ..utils.data_cleaner import data_cleaner
 from ..utils.address_parser import address_parser
 from ..models import Dealer
 
+# Import will be handled gracefully if xlsxwriter not available
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Memoized per-record cleaners. Each result depends only on its string
+# argument, and names, cities and states recur across a group's pages and
+# re-scrapes; call .cache_clear() to release them in long-running processes.
+_normalize_name = lru_cache(maxsize=4096)(data_cleaner.normalize_name)
+_normalize_city = lru_cache(maxsize=4096)(data_cleaner.normalize_city)
+_normalize_street = lru_cache(maxsize=4096)(address_parser.normalize_address_abbreviations)
+_extract_phone_number = lru_cache(maxsize=4096)(data_cleaner.extract_phone_number)
+_normalize_website = lru_cache(maxsize=4096)(data_cleaner.normalize_website)
+_classify_dealer_type = lru_cache(maxsize=4096)(data_cleaner.classify_dealer_type)
+_extract_car_brands = lru_cache(maxsize=4096)(data_cleaner.extract_car_brands)
+_determine_country = lru_cache(maxsize=128)(data_cleaner.determine_country)
+
 class DataService:
     """Service for data processing and transformation operations."""
     
@@ -61,28 +81,28 @@ class DataService:
         """Create and validate a Dealer model from raw data."""
         try:
             # Extract and clean basic info
-            name = data_cleaner.normalize_name(dealer.get("name", "") or dealer.get("Name", ""))
+            name = _normalize_name(dealer.get("name", "") or dealer.get("Name", ""))
             if not name:
                 return None
             
             # Process address
             street = dealer.get("street", "") or dealer.get("Street", "")
-            city = data_cleaner.normalize_city(dealer.get("city", "") or dealer.get("City", ""))
+            city = _normalize_city(dealer.get("city", "") or dealer.get("City", ""))
             state = (dealer.get("state", "") or dealer.get("State", "")).strip().upper()
             zip_code = (dealer.get("zip", "") or dealer.get("Zip", "")).strip()
             
             # Normalize address
             if street:
-                street = address_parser.normalize_address_abbreviations(street)
+                street = _normalize_street(street)
             
             # Extract contact info
-            phone = data_cleaner.extract_phone_number(dealer.get("phone", "") or dealer.get("Phone", ""))
-            website = data_cleaner.normalize_website(dealer.get("website", "") or dealer.get("Website", ""))
+            phone = _extract_phone_number(dealer.get("phone", "") or dealer.get("Phone", ""))
+            website = _normalize_website(dealer.get("website", "") or dealer.get("Website", ""))
             
             # Classify and enrich
-            dealer_type = data_cleaner.classify_dealer_type(name)
-            car_brands = data_cleaner.extract_car_brands(name)
-            country = data_cleaner.determine_country(state)
+            dealer_type = _classify_dealer_type(name)
+            car_brands = _extract_car_brands(name)
+            country = _determine_country(state)
             
             # Create Pydantic model
             return Dealer(
@@ -129,7 +149,10 @@ class DataService:
         df = self.create_dataframe(dealers)
         
         buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        # xlsxwriter writes the workbook faster than openpyxl; its
+        # constant_memory mode is not used because pandas writes column by column
+        engine = "xlsxwriter" if XLSXWRITER_AVAILABLE else "openpyxl"
+        with pd.ExcelWriter(buffer, engine=engine) as writer:
             df.to_excel(writer, index=False, sheet_name="Dealer Locations")
         
         buffer.seek(0)
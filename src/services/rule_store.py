@@ -28,6 +28,9 @@ class RuleStore:
     def __init__(self, rules_path: Optional[str] = None):
         self.rules_path = rules_path or os.environ.get("RULES_PATH", "rules.json")
         self._lock = threading.Lock()
+        # ((mtime_ns, size), parsed rules) from the last read, so lookups only
+        # re-read the file after it changes on disk
+        self._cached = (None, {})
         self._ensure_file()
 
     def _ensure_file(self) -> None:
@@ -44,12 +47,28 @@ class RuleStore:
             except Exception:
                 return {}
 
+    def _load_cached(self) -> Dict[str, Any]:
+        """Parsed rules file, shared between lookups until the file changes."""
+        try:
+            stat = os.stat(self.rules_path)
+            key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+        cached_key, cached_data = self._cached
+        if key is not None and key == cached_key:
+            return cached_data
+        data = self._load()
+        self._cached = (key, data)
+        return data
+
     def _save(self, data: Dict[str, Any]) -> None:
         with self._lock:
             Path(self.rules_path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            # A same-size write can keep the old mtime on coarse-grained filesystems
+            self._cached = (None, {})
 
     def list_for_host(self, host: str) -> List[DomainRule]:
-        data = self._load()
+        data = self._load_cached()
         items = data.get(host, [])
         return [DomainRule(**it) for it in items]
 
@@ -6,12 +6,14 @@ operations with proper error handling and logging.
 """
 
 import logging
+import multiprocessing
 import re
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 from dataclasses import dataclass
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from ..scrapers.strategy_manager import get_configured_scraper
 from .web_scraper import WebScraper
@@ -19,6 +21,32 @@ from .data_service import DataService
 from ..scrapers.strategies.new_llm_strategy import NewLLMExtractorStrategy
 from ..config import config
 
+
+# Process-local scraper used by extraction pool workers
+_worker_extractor = None
+
+
+def _extract_page(html_content: str, url: str) -> List[Dict[str, Any]]:
+    """Run strategy extraction for one page inside a worker process."""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = get_configured_scraper()
+    return _worker_extractor.extract_dealer_data(html_content, url)
+
+
+def _create_extraction_pool(task_count: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Create a process pool for extracting task_count pages, or None to extract inline.
+    
+    Workers are spawned rather than forked: the pool is used alongside fetch
+    threads, and forking a process with live threads can deadlock.
+    """
+    workers = min(config.EXTRACTION_WORKERS, task_count)
+    if workers <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
 class ScrapingStatus(Enum):
     """Status codes for scraping operations."""
     SUCCESS = "success"
@@ -51,7 +79,8 @@ class ScraperService:
         self.extractor = get_configured_scraper()
         self.llm_fallback = NewLLMExtractorStrategy()
     
-    def scrape_dealer_locations(self, dealer_name: str, url: str, progress_callback=None) -> ScrapingResult:
+    def scrape_dealer_locations(self, dealer_name: str, url: str, progress_callback=None,
+                                extraction_pool: Optional[ProcessPoolExecutor] = None) -> ScrapingResult:
         """
         Scrape dealer locations from a given URL.
         
@@ -59,6 +88,7 @@ class ScraperService:
             dealer_name: Name of the dealer group
             url: URL to scrape
             progress_callback: Optional callback for progress updates
+            extraction_pool: Optional process pool to run HTML extraction in
             
         Returns:
             ScrapingResult with status and extracted data
@@ -83,7 +113,7 @@ class ScraperService:
             if progress_callback:
                 progress_callback(50, "Analyzing website structure...")
             
-            raw_dealers = self.extractor.extract_dealer_data(html_content, url)
+            raw_dealers = self._extract_dealer_data(html_content, url, extraction_pool)
             
             # Step 3: Process and validate data
             if progress_callback:
@@ -93,7 +123,7 @@ class ScraperService:
 
             # Step 4: Retry Logic (Force Playwright)
             if not processed_dealers:
-                processed_dealers = self._retry_with_playwright(url, dealer_name, progress_callback)
+                processed_dealers = self._retry_with_playwright(url, dealer_name, progress_callback, extraction_pool)
             
             # Step 5: Fallback Logic (LLM & Sitemap)
             if not processed_dealers:
@@ -130,7 +160,18 @@ class ScraperService:
                 error=str(e)
             )
 
-    def _retry_with_playwright(self, url: str, dealer_name: str, progress_callback) -> List[Dict[str, Any]]:
+    def _extract_dealer_data(self, html_content: str, url: str,
+                             extraction_pool: Optional[ProcessPoolExecutor] = None) -> List[Dict[str, Any]]:
+        """Extract raw dealers from HTML, in the given process pool when one is supplied."""
+        if extraction_pool is not None:
+            try:
+                return extraction_pool.submit(_extract_page, html_content, url).result()
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Extraction pool unavailable, extracting inline: {e}")
+        return self.extractor.extract_dealer_data(html_content, url)
+
+    def _retry_with_playwright(self, url: str, dealer_name: str, progress_callback,
+                               extraction_pool: Optional[ProcessPoolExecutor] = None) -> List[Dict[str, Any]]:
         """Retry scraping using forced Playwright execution."""
         if progress_callback:
             progress_callback(70, "No dealers found, trying enhanced scraping...")
@@ -139,7 +180,7 @@ class ScraperService:
         html_content_retry = self.web_scraper.fetch_page(url, force_playwright=True)
         
         if html_content_retry:
-            raw_dealers_retry = self.extractor.extract_dealer_data(html_content_retry, url)
+            raw_dealers_retry = self._extract_dealer_data(html_content_retry, url, extraction_pool)
             return self.data_service.process_dealer_data(raw_dealers_retry, dealer_name)
         return []
 
@@ -168,26 +209,37 @@ class ScraperService:
     def scrape_multiple_urls(self, dealer_name: str, urls: List[str]) -> ScrapingResult:
         """
         Scrape multiple URLs for a dealer group concurrently.
+        
+        Pages are fetched on a thread pool. When EXTRACTION_WORKERS is above 1,
+        the CPU-bound strategy extraction for each fetched page runs on a
+        process pool so it scales across cores.
         """
         all_dealers = []
         errors = []
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_url = {
-                executor.submit(self.scrape_dealer_locations, dealer_name, url): url 
-                for url in urls
-            }
-            
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    result = future.result()
-                    if result.success:
-                        all_dealers.extend(result.dealers)
-                    elif result.error:
-                        errors.append(f"{url}: {result.error}")
-                except Exception as e:
-                    errors.append(f"{url}: {str(e)}")
+        # Created before the fetch threads start
+        extraction_pool = _create_extraction_pool(len(urls))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                future_to_url = {
+                    executor.submit(self.scrape_dealer_locations, dealer_name, url, None, extraction_pool): url 
+                    for url in urls
+                }
+                
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        result = future.result()
+                        if result.success:
+                            all_dealers.extend(result.dealers)
+                        elif result.error:
+                            errors.append(f"{url}: {result.error}")
+                    except Exception as e:
+                        errors.append(f"{url}: {str(e)}")
+        finally:
+            if extraction_pool is not None:
+                extraction_pool.shutdown()
         
         unique_dealers = self.data_service.deduplicate_dealers(all_dealers)
         
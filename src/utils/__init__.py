@@ -2,13 +2,19 @@
 Utilities package for dealer scraping application.
 
 This package contains utility modules for address parsing,
-data cleaning, and validation operations.
+data cleaning, layout signatures, parse reuse and validation operations.
 """
 
 from .address_parser import AddressParser, parse_address, address_parser
 from .data_cleaner import DataCleaner, data_cleaner
+from .json_loader import loads_json
+from .layout_signature import generate_layout_signature
+from .parse_cache import LastParseCache
 
 __all__ = [
     'AddressParser', 'parse_address', 'address_parser',
-    'DataCleaner', 'data_cleaner'
+    'DataCleaner', 'data_cleaner',
+    'loads_json',
+    'generate_layout_signature',
+    'LastParseCache'
 ]
\ No newline at end of file
@@ -6,9 +6,36 @@ from various dealer website formats.
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 
 
+# Street words and their abbreviations, matched case-insensitively in a single
+# pass; the group that matched picks the abbreviation
+_STREET_ABBREVIATIONS = (
+    ("Street", "St"),
+    ("Avenue", "Ave"),
+    ("Boulevard", "Blvd"),
+    ("Highway", "Hwy"),
+    ("Lane", "Ln"),
+    ("Drive", "Dr"),
+    ("Road", "Rd"),
+    ("Parkway", "Pkwy"),
+    ("Expressway", "Expy"),
+)
+_STREET_WORD_RE = re.compile(
+    "|".join(rf"\b({word})\b" for word, _ in _STREET_ABBREVIATIONS), re.IGNORECASE
+)
+
+# Abbreviations that title() lowercases and are restored to uppercase
+_UPPERCASE_ABBREVS = ("NE", "NW", "SE", "SW", "GMC", "FIAT", "RAM", "BMW", "USA", "II", "III", "IV")
+_UPPERCASE_ABBREV_RE = re.compile(
+    r"\b(" + "|".join(abbr.title() for abbr in _UPPERCASE_ABBREVS) + r")(?=\b|[.,;:!?\s]|$)"
+)
+
+_TRAILING_PUNCTUATION_RE = re.compile(r"[.,\s]+$")
+
+
 class AddressParser:
     """Handles parsing of address strings into components."""
     
@@ -130,33 +157,18 @@ class AddressParser:
             return ""
             
         # Apply common abbreviations
-        abbreviations = {
-            r"\bStreet\b": "St",
-            r"\bAvenue\b": "Ave", 
-            r"\bBoulevard\b": "Blvd",
-            r"\bHighway\b": "Hwy",
-            r"\bLane\b": "Ln",
-            r"\bDrive\b": "Dr",
-            r"\bRoad\b": "Rd",
-            r"\bParkway\b": "Pkwy",
-            r"\bExpressway\b": "Expy"
-        }
-        
-        normalized = address
-        for pattern, replacement in abbreviations.items():
-            normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
+        normalized = _STREET_WORD_RE.sub(
+            lambda m: _STREET_ABBREVIATIONS[m.lastindex - 1][1], address
+        )
         
         # Convert to title case
         normalized = normalized.title()
         
         # Restore common abbreviations to uppercase
-        uppercase_abbrevs = ["NE", "NW", "SE", "SW", "GMC", "FIAT", "RAM", "BMW", "USA", "II", "III", "IV"]
-        for abbr in uppercase_abbrevs:
-            pattern = rf"\b{abbr.title()}(?=\b|[.,;:!?\s]|$)"
-            normalized = re.sub(pattern, abbr, normalized)
+        normalized = _UPPERCASE_ABBREV_RE.sub(lambda m: m.group(1).upper(), normalized)
         
         # Remove trailing punctuation and spaces
-        normalized = re.sub(r"[.,\s]+$", "", normalized)
+        normalized = _TRAILING_PUNCTUATION_RE.sub("", normalized)
         
         return normalized
 
@@ -164,7 +176,10 @@ class AddressParser:
 # Create singleton instance for easy importing
 address_parser = AddressParser()
 
-# Convenience function for backward compatibility
+# Convenience function for backward compatibility. Results are memoized since
+# the same address strings recur across pages and re-scrapes of a site; call
+# parse_address.cache_clear() to release the cache in long-running processes.
+@lru_cache(maxsize=4096)
 def parse_address(address_text: str) -> Tuple[str, str, str, str]:
     """Parse address string into components."""
     return address_parser.parse_address(address_text)
\ No newline at end of file
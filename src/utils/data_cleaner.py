@@ -9,6 +9,14 @@ import re
 from typing import Dict, List, Any
 
 
+# Abbreviations that title() lowercases and normalize_name restores, matched
+# in their title-cased form in a single pass
+_UPPERCASE_ABBREVS = ("NE", "NW", "SE", "SW", "GMC", "FIAT", "RAM", "BMW", "USA", "II", "III", "IV", "LLC", "INC", "LTD")
+_UPPERCASE_ABBREV_RE = re.compile(
+    r"\b(" + "|".join(abbr.title() for abbr in _UPPERCASE_ABBREVS) + r")(?=\b|[.,;:!?\s]|$)"
+)
+
+
 class DataCleaner:
     """Handles cleaning and validation of dealer data."""
     
@@ -75,12 +83,7 @@ class DataCleaner:
         normalized = name.strip().title()
         
         # Restore common abbreviations to uppercase
-        uppercase_abbrevs = ["NE", "NW", "SE", "SW", "GMC", "FIAT", "RAM", "BMW", "USA", "II", "III", "IV", "LLC", "INC", "LTD"]
-        for abbr in uppercase_abbrevs:
-            pattern = rf"\b{abbr.title()}(?=\b|[.,;:!?\s]|$)"
-            normalized = re.sub(pattern, abbr, normalized)
-        
-        return normalized
+        return _UPPERCASE_ABBREV_RE.sub(lambda m: m.group(1).upper(), normalized)
     
     def normalize_city(self, city: str) -> str:
         """Normalize city name."""
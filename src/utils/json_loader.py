@@ -0,0 +1,41 @@
+"""
+JSON decoding utilities for data embedded in dealer pages.
+
+This module decodes JSON with orjson when it is installed and falls
+back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+# Import will be handled gracefully if orjson not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document from a str or UTF-8 bytes.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON, including
+            bytes that are not valid UTF-8
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The json module also accepts NaN/Infinity, integers wider than
+            # 64 bits and lone surrogates, so give it the final say
+            pass
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        # Undecodable bytes raise UnicodeDecodeError from the json module
+        raise json.JSONDecodeError(str(e), "", 0) from e
@@ -0,0 +1,76 @@
+"""
+Layout signature utilities for learned extraction rules.
+
+A layout signature summarises the structure of a dealer page (location
+containers, list items, address/phone/state+ZIP text) so pages with a
+similar layout can share pattern-based rules.
+"""
+
+import re
+
+from bs4 import BeautifulSoup, NavigableString
+
+
+_CONTAINER_CLASS_KEYWORDS = ('location', 'dealer', 'store', 'office', 'branch')
+_STREET_ADDRESS_RE = re.compile(r'\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Dr|Drive)')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_STATE_ZIP_RE = re.compile(r'\b[A-Z]{2}\s+\d{5}')  # State code + ZIP
+
+
+def _is_location_container_class(css_class) -> bool:
+    return bool(css_class) and any(keyword in css_class.lower() for keyword in _CONTAINER_CLASS_KEYWORDS)
+
+
+def generate_layout_signature(soup: BeautifulSoup) -> str:
+    """
+    Generate a layout signature based on HTML structure patterns.
+    
+    Returns:
+        "layout:" followed by the sorted pattern indicators, or "" when
+        fewer than two indicators are present
+    """
+    try:
+        # Analyze structure patterns
+        signatures = []
+        
+        # Count common container patterns
+        sections = len(soup.find_all(['section', 'div', 'article'], class_=_is_location_container_class))
+        if sections >= 3:
+            signatures.append(f"containers:{sections}")
+        
+        # Check for list patterns
+        lists = soup.find_all(['ul', 'ol'])
+        list_items = sum(len(lst.find_all('li')) for lst in lists)
+        if list_items >= 3:
+            signatures.append(f"lists:{list_items}")
+        
+        # Check for address-like, phone and state+ZIP (common in dealer
+        # listings) patterns in one pass over the text nodes; each only
+        # needs to be seen three times
+        addresses = phones = states = 0
+        for node in soup.descendants:
+            if not isinstance(node, NavigableString) or not node:
+                continue
+            if addresses < 3 and _STREET_ADDRESS_RE.search(node):
+                addresses += 1
+            if phones < 3 and _PHONE_RE.search(node):
+                phones += 1
+            if states < 3 and _STATE_ZIP_RE.search(node):
+                states += 1
+            if addresses >= 3 and phones >= 3 and states >= 3:
+                break
+        if addresses >= 3:
+            signatures.append("addresses:multiple")
+        if phones >= 3:
+            signatures.append("phones:multiple")
+        if states >= 3:
+            signatures.append("states:multiple")
+        
+        # Generate final signature
+        if len(signatures) >= 2:  # Need at least 2 pattern indicators
+            return "layout:" + "|".join(sorted(signatures))
+        
+        return ""
+        
+    except Exception:
+        return ""
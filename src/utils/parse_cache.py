@@ -0,0 +1,34 @@
+"""
+Parse reuse between a strategy's can_handle and extract_dealers calls.
+
+BaseScraper.extract_dealer_data passes the same html object to both calls,
+so a strategy can keep the result of its last parse and hand it back when
+it sees that object again.
+"""
+
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LastParseCache(Generic[T]):
+    """
+    Single-slot cache of parse(html) for the most recent html.
+
+    The slot is keyed on object identity (``is``), not equality: it only
+    helps when the caller passes the very same html object again, and an
+    equal but distinct string is parsed afresh. This keeps the lookup O(1)
+    instead of comparing whole pages.
+    """
+
+    def __init__(self, parse: Callable[[str], T]):
+        self._parse = parse
+        self._last: Tuple[Optional[str], Optional[T]] = (None, None)
+
+    def __call__(self, html: str) -> T:
+        cached_html, cached_result = self._last
+        if cached_html is html:
+            return cached_result
+        result = self._parse(html)
+        self._last = (html, result)
+        return result
@@ -1,5 +1,6 @@
 import sys
 import os
+import json
 from pathlib import Path
 import pytest
 
@@ -8,6 +9,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.models import Dealer
 from src.utils.data_cleaner import data_cleaner
+from src.utils.address_parser import parse_address
+from src.utils.json_loader import loads_json
+from src.utils.layout_signature import generate_layout_signature
+from src.utils.parse_cache import LastParseCache
+from src.services.rule_store import RuleStore, DomainRule
+from bs4 import BeautifulSoup
 
 def test_dealer_model_validation():
     """Test that Dealer model validates data correctly."""
@@ -45,3 +52,59 @@ def test_data_cleaner_normalization():
     assert data_cleaner.normalize_name("test motors llc") == "Test Motors LLC"
     assert data_cleaner.normalize_city("new york, ") == "New York"
     assert data_cleaner.normalize_website("https://www.example.com/") == "example.com"
+
+def test_parse_address_repeated_calls_agree():
+    """Test that parsing the same address again gives the same result."""
+    address = "222 W Merchandise Mart Plaza, Chicago, IL 60654, USA"
+    expected = ("222 W Merchandise Mart Plaza", "Chicago", "IL", "60654")
+    assert parse_address(address) == expected
+    assert parse_address(address) == expected
+
+
+def test_last_parse_cache_is_keyed_on_identity():
+    """Test that only the same html object reuses the last parse."""
+    calls = []
+    parse = LastParseCache(lambda html: calls.append(html) or len(calls))
+    html = "<p>" + "x" * 10 + "</p>"
+    assert parse(html) == parse(html) == 1
+    assert parse("".join(html)) == 2  # equal but distinct string is parsed again
+    assert len(calls) == 2
+
+
+def test_loads_json_matches_stdlib():
+    """Test that JSON decoding accepts what the json module accepts and raises its error."""
+    assert loads_json('[{"name": "Acme Ford"}]') == [{"name": "Acme Ford"}]
+    assert loads_json(b'{"zip": "78701"}') == {"zip": "78701"}
+    assert loads_json("[NaN]")[0] != loads_json("[NaN]")[0]
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("[bad json]")
+
+
+def test_loads_json_rejects_invalid_utf8():
+    """Test that undecodable bytes raise JSONDecodeError rather than UnicodeDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        loads_json(b"\x80<html>")
+
+
+def test_generate_layout_signature():
+    """Test that each text pattern counts once it appears in three text nodes."""
+    html = "<ul>" + "".join(
+        f"<li>{i}0 Main Street</li><li>Austin, TX 7870{i}</li>" for i in range(3)
+    ) + "</ul><p>(512) 555-1212</p>"
+    assert generate_layout_signature(BeautifulSoup(html, "lxml")) == "layout:addresses:multiple|lists:6|states:multiple"
+    assert generate_layout_signature(BeautifulSoup("<p>1 Main Street</p>", "lxml")) == ""
+
+
+def test_rule_store_lookup_sees_upserts(tmp_path):
+    """Test that cached host lookups are refreshed after the rules file changes."""
+    store = RuleStore(str(tmp_path / "rules.json"))
+    assert store.list_for_host("example.com") == []
+    rule = DomainRule(host="example.com", path_pattern="/locations", version=1,
+                      card_selector="div.card", fields={"name": "h3"}, dom_signature="")
+    store.upsert(rule)
+    assert store.list_for_host("example.com") == [rule]
+    store.upsert(DomainRule(**{**rule.__dict__, "version": 2, "card_selector": "li.card"}))
+    assert [r.card_selector for r in store.list_for_host("example.com")] == ["li.card"]
+    # Same-size rewrite, which the (mtime, size) key alone may not notice
+    store.upsert(DomainRule(**{**rule.__dict__, "version": 3, "card_selector": "li.item"}))
+    assert [r.card_selector for r in store.list_for_host("example.com")] == ["li.item"]
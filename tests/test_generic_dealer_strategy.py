@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+from bs4 import BeautifulSoup
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.strategies.generic_dealer_strategy import GenericDealerStrategy
+from src.utils.parse_cache import LastParseCache
+
+BANISTER_HTML = "<html><body>" + "".join(
+    f"""<div class="panel panel-default"><h3><strong>Banister {i} Ford</strong></h3>
+    <p class="larger">93{i} N Battlefield Blvd<br>Chesapeake, VA 23320</p>
+    <p class="larger">(757) 555-000{i}</p></div>"""
+    for i in range(3)
+) + "</body></html>"
+
+
+def test_can_handle_rejects_unrelated_page():
+    """Test that pages without any dealer markers are rejected."""
+    strategy = GenericDealerStrategy()
+    html = "<html><body><h1>Hello</h1><p>Nothing here</p></body></html>"
+    assert not strategy.can_handle(html, "https://example.com")
+
+
+def test_can_handle_accepts_directions_and_contact_links():
+    """Test that a card with Directions/Contact links is accepted, as DealerOn pages need."""
+    strategy = GenericDealerStrategy()
+    html = (
+        '<html><body><div class="card"><h3>Store 1</h3><p>1 Main St</p>'
+        '<a href="/map">Get Directions</a> <a href="/contact"><span>Contact Us</span></a></div></body></html>'
+    )
+    assert strategy.can_handle(html, "https://example.com")
+
+
+def test_can_handle_rejects_common_words_without_parsing():
+    """Test that dealer-ish words outside card classes and links don't get a page parsed."""
+    strategy = GenericDealerStrategy()
+    parsed = []
+    strategy._parse = LastParseCache(parsed.append)
+    html = '<html><body><div class="contact"><h2>Contact your dealer</h2><p>Directions below</p></div></body></html>'
+    assert not strategy.can_handle(html, "https://example.com")
+    assert parsed == []
+
+
+def test_extract_dealers_runs_detected_layout_only():
+    """Test that only extractors whose layout is present contribute dealers."""
+    strategy = GenericDealerStrategy()
+    assert strategy.can_handle(BANISTER_HTML, "https://example.com/locations")
+
+    dealers = strategy.extract_dealers(BANISTER_HTML, "https://example.com/locations")
+    banister = [d for d in dealers if d["street"] == "930 N Battlefield Blvd"]
+    assert banister
+    assert banister[0]["name"] == "Banister 0 Ford"
+    assert banister[0]["city"] == "Chesapeake"
+    assert banister[0]["phone"] == "(757) 555-0000"
+    soup = BeautifulSoup(BANISTER_HTML, "html.parser")
+    gate_cards = strategy._collect_gate_cards(soup)
+    assert set(gate_cards) == {"Banister", "Ken Ganley"}
+    assert len(gate_cards["Banister"]) == 3
+
+
+def test_default_parse_keeps_body_level_address_text():
+    """Test that heading/address text directly under <body> survives the default parse."""
+    html = "<html><body><h1>Our Locations</h1>" + "".join(
+        f"<h3>Store {i}</h3>1{i} Main St<br>Columbus, OH 4321{i}<br>(614) 555-121{i}"
+        for i in range(3)
+    ) + "</body></html>"
+    url = "https://example.com/locations"
+
+    dealers = GenericDealerStrategy().extract_dealers(html, url)
+    assert {d["city"] for d in dealers} == {"Columbus"}
+    assert len(dealers) == 3
+
+
+def test_strained_parse_matches_full_parse_on_card_layouts():
+    """Test that the opt-in strained parse extracts the same card dealers as a full parse."""
+    autobell_html = "<html><body>" + "".join(
+        f"<div><h2>12{i} Fake St <span>{i} miles away</span></h2>"
+        f"<address>12{i} Fake St<br>Charlotte, NC 2820{i}</address></div>"
+        for i in range(3)
+    ) + "</body></html>"
+    for html in (BANISTER_HTML, autobell_html):
+        full = GenericDealerStrategy(full_parse=True).extract_dealers(html, "https://example.com")
+        strained = GenericDealerStrategy(full_parse=False).extract_dealers(html, "https://example.com")
+        assert full and strained == full
+
+
+def test_autobell_address_split_on_br():
+    """Test that AutoBell city, state and ZIP come from the line after the <br>."""
+    strategy = GenericDealerStrategy()
+    html = (
+        "<div><h2>123 Fake St <span>2 miles away</span></h2>"
+        "<address>123 Fake St<br>Charlotte, NC 28202</address></div>"
+    )
+    soup = BeautifulSoup(html, "lxml")
+
+    dealers = strategy._extract_autobell_dealers(soup.select("h2 span"), "https://autobell.com")
+    assert len(dealers) == 1
+    assert (dealers[0]["city"], dealers[0]["state"], dealers[0]["zip"]) == ("Charlotte", "NC", "28202")
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.strategies.group1_automotive_strategy import Group1AutomotiveStrategy
+
+MULTI_CLASS_HTML = "<html><body><div class='dealerResults'>" + "".join(
+    f"""<div class="dealerResults__listing is-active">
+    <div class="dealerResults__listing--name">Group 1 Toyota {i}</div>
+    <div class="dealerResults__listing--address">10{i} Main St, Houston, TX 77034</div>
+    <div class="dealerResults__listing--phoneSales"><a href="tel:713555000{i}">Sales</a></div></div>"""
+    for i in range(3)
+) + "</div></body></html>"
+
+
+def test_multi_class_listings_are_detected_and_extracted():
+    """Test that listings carrying extra classes are still treated as listings."""
+    strategy = Group1AutomotiveStrategy()
+    url = "https://www.group1auto.com/dealerships"
+    assert strategy.can_handle(MULTI_CLASS_HTML, url)
+
+    dealers = strategy.extract_dealers(MULTI_CLASS_HTML, url)
+    assert [d["Name"] for d in dealers] == [f"Group 1 Toyota {i}" for i in range(3)]
+    assert dealers[0]["City"] == "Houston"
+    assert dealers[0]["Phone"] == "7135550000"
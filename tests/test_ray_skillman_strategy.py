@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.strategies.ray_skillman_strategy import RaySkillmanStrategy
+
+
+def _ld_script(name: str, type_attr: str = "application/ld+json") -> str:
+    return (
+        f'<script type="{type_attr}">{{"@type": "AutoDealer", "name": "{name}", '
+        '"address": {"streetAddress": "1 A St", "addressLocality": "Indianapolis", '
+        '"addressRegion": "IN", "postalCode": "46201"}}</script>'
+    )
+
+
+def test_json_ld_only_from_live_script_elements():
+    """Test that commented-out and differently-typed JSON-LD scripts are ignored."""
+    html = (
+        "<html><head>" + _ld_script("RS Ford")
+        + "<!-- " + _ld_script("RS Retired") + " -->"
+        + _ld_script("RS Upper", "Application/LD+JSON")
+        + "</head><body><p>Ray Skillman</p></body></html>"
+    )
+    dealers = RaySkillmanStrategy().extract_dealers(html, "https://www.rayskillman.com/locations")
+    assert [d["name"] for d in dealers] == ["RS Ford"]
+    assert dealers[0]["city"] == "Indianapolis"